@@ -1,13 +1,31 @@
 """
 PKPM-CAE 叠合梁参数化建模 - 钢筋布置引擎
+
+性能说明：
+- 热点（箍筋批量生成 _create_i_stirrups_batch、洞口小梁箍筋 _create_hole_small_beam_stirrups）
+  主要耗时在 Node/Element 对象的创建与列表追加上，坐标算术占比很小；
+- 因此优化应优先减少逐对象的 Python 开销（模板复用、批量推导、循环外提），
+  而不是对坐标计算做向量化/SIMD；
+- 设置环境变量 PKPM_LINE_PROFILE=1 且已安装 line_profiler 时，上述函数自动挂载逐行计时，
+  用于按实测耗时决定下一步优化方向。
+- 单道箍筋已不再逐道计算：截面模板按参数缓存，整段沿 X 平移展开，剩余耗时几乎全在对象构造上；
+  Cython/AOT 编译扩展对此无收益，且会给 PyInstaller 打包引入编译步骤，因此本模块保持纯 Python。
+- 过程信息走 logging（logger 名 core.rebar_engine）：洞口补强摘要与箍筋参数为 INFO，标高调整为 WARNING；
+  本模块自带 stdout handler，命令行/UI/直接导入均与原 print 一样输出到 stdout，无需入口脚本配置。
 """
 
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Dict, Tuple
+import bisect
+import gc
+import itertools
+import logging
 import math
-import sys
 import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import sys
 
 try:
     from pypcae.comp import Node, Element
@@ -15,26 +33,318 @@ try:
 except ImportError:
     print("警告: PyPCAE 模块未安装，使用模拟模式")
 
+    # 模拟模式的编号发生器：itertools.count 在 C 层递增，避免每个对象对类属性做读-改-写
+    # __slots__：箍筋/纵筋会生成数万个对象，去掉逐实例 __dict__ 以降低内存与 GC 开销
     class Node:
-        _id_counter = 10000
+        __slots__ = ('x', 'y', 'z', 'id')
+        _ids = itertools.count(10000)
         def __init__(self, x, y, z):
             self.x, self.y, self.z = x, y, z
-            self.id = Node._id_counter
-            Node._id_counter += 1
+            self.id = next(Node._ids)
 
     class Element:
-        _id_counter = 20000
+        # diameter 在构造后由 _tag_elements_diameter 统一标注
+        __slots__ = ('nodes', 'etype', 'id', 'diameter')
+        _ids = itertools.count(20000)
         def __init__(self, nodes, etype=None):
             self.nodes = nodes
             self.etype = etype
-            self.id = Element._id_counter
-            Element._id_counter += 1
+            self.id = next(Element._ids)
 
     class EleType:
         Link = "Link"
 
+if not __package__:
+    # 直接以脚本运行（python core/rebar_engine.py）时补上工程根目录；作为 core 包导入时不改 sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from core.parameters import GeometryParams, LongitudinalRebar, StirrupParams, HoleParams
 
+class _StdoutHandler(logging.Handler):
+    """
+    把本模块的过程信息写到“调用时”的 sys.stdout（与 print 行为一致）：
+    - CLI 重定向、UI/测试替换 sys.stdout 后同样跟随，且与周围 print 输出顺序一致；
+    - 无控制台（PyInstaller 窗口模式 sys.stdout 为 None）时静默丢弃，与 print 相同。
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        stream = sys.stdout
+        if stream is None:
+            return
+        try:
+            stream.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+# 模块自带 stdout 输出：不依赖入口脚本配置 logging，直接导入本模块时提示信息同样可见；
+# 不向 root 传播，避免外部 basicConfig 时重复输出。需要静默时调高本 logger 的级别即可。
+log = logging.getLogger(__name__)
+log.addHandler(_StdoutHandler())
+log.setLevel(logging.INFO)
+log.propagate = False
+
+
+# 批量取节点编号：编号由 Node 构造时分配（pypcae 内部维护），此处只在 C 层一次性收集
+_node_id = attrgetter("id")
+
+
+def _profile(func):
+    """按需挂载 line_profiler（PKPM_LINE_PROFILE=1 且可导入时生效，否则原样返回）"""
+    if not os.environ.get("PKPM_LINE_PROFILE"):
+        return func
+    try:
+        from line_profiler import profile
+    except ImportError:
+        return func
+    return profile(func)
+
+
+@lru_cache(maxsize=None)
+def _segment_pairs(num_segments: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    纵筋分段连接表：((0, 1), (1, 2), ..., (n-1, n))
+
+    同一模型中 num_segments 只有少数几种取值（30/10），按段数缓存后各钢筋线直接复用。
+    """
+    return tuple((i, i + 1) for i in range(int(num_segments)))
+
+
+def _clip(x: float, lo: float, hi: float) -> float:
+    """
+    标量夹取，等价于 max(lo, min(hi, x))（lo > hi 时返回 lo）
+    """
+    if x > hi:
+        x = hi
+    return lo if x < lo else x
+
+
+def _x_grid(x0: float, spacing: float, n: int, x_limit: float) -> List[float]:
+    """
+    X 向等间距布点：x0 + i*spacing（i = 0..n-1）中不超过 x_limit 的点
+
+    spacing > 0 时序列递增，超限的只可能是尾部，逐个弹出即可，无需对每个点重复求值判断。
+    """
+    xs = [x0 + i * spacing for i in range(n)]
+    if spacing > 0:
+        while xs and xs[-1] > x_limit:
+            xs.pop()
+        return xs
+    return [x for x in xs if x <= x_limit]
+
+
+def _outside_spans(xs: List[float], spans, tol: float = 1e-6) -> List[float]:
+    """
+    过滤掉落在任一闭区间 [a-tol, b+tol] 内的 X（保持原顺序）
+
+    区间先排序并合并为互不重叠的 (starts, ends)，每个 X 只需一次二分查找，
+    不再对每个 X 逐个遍历全部区间。
+    """
+    if not spans:
+        return list(xs)
+    starts: List[float] = []
+    ends: List[float] = []
+    for a, b in sorted((a - tol, b + tol) for a, b in spans):
+        if ends and a <= ends[-1]:
+            if b > ends[-1]:
+                ends[-1] = b
+        else:
+            starts.append(a)
+            ends.append(b)
+    out = []
+    for x in xs:
+        k = bisect.bisect_right(starts, x) - 1
+        if k < 0 or x > ends[k]:
+            out.append(x)
+    return out
+
+
+@lru_cache(maxsize=256)
+def _zone_x_positions(x_start: float, x_end: float, spacing: float,
+                      skip_ranges: Tuple[Tuple[float, float], ...] = ()) -> Tuple[float, ...]:
+    """
+    箍筋区段的 X 位置：x_start 起按 spacing 布点（不超过 x_end），剔除洞口避让范围
+
+    纯数值且只取决于参数：参数化批量建模时各变体的区段往往完全相同，按参数缓存后直接复用。
+    """
+    num_stirrups = int((x_end - x_start) / spacing) + 1
+    return tuple(_outside_spans(_x_grid(x_start, spacing, num_stirrups, x_end), skip_ranges))
+
+
+@contextmanager
+def _gc_paused():
+    """
+    批量创建 Node/Element 期间暂停循环垃圾回收
+
+    批量构造只新增对象、不产生循环引用，但新对象数量会反复触发第 0 代回收并遍历全部新对象；
+    暂停后分配开销约减半。退出时恢复进入前的 GC 状态。
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _bulk_nodes(xs: List[float], ys: List[float], zs: List[float]) -> Tuple[List, List]:
+    """
+    按分量坐标列批量创建节点，返回 (节点列表, 节点编号列表)
+
+    编号由 Node 构造时分配，这里只在 C 层一次性收集，供 _bulk_links 按下标连接。
+    """
+    with _gc_paused():
+        nodes = list(map(Node, xs, ys, zs))
+    return nodes, list(map(_node_id, nodes))
+
+
+def _bulk_links(ids: List[int], pairs, offsets=(0,)) -> List:
+    """
+    按节点下标对批量创建 Link 单元：对 offsets 中每个偏移 off，依次连接 ids[off+a] - ids[off+b]
+
+    同一连接模式重复出现时（多根钢筋/多道箍筋）只需传入一份 pairs 与各自的起始偏移。
+    两端节点 id 以二元组传入：比 list 更小、无过量分配，下游只按下标读取 nodes[0]/nodes[1]。
+    """
+    _Element, link = Element, EleType.Link
+    with _gc_paused():
+        return [_Element((ids[off + a], ids[off + b]), etype=link) for off in offsets for a, b in pairs]
+
+
+def _x_grid_closed(x0: float, x1: float, spacing: float) -> List[float]:
+    """
+    [x0, x1] 内按间距布点并保证包含两端（坐标保留 6 位小数，升序、不重复）
+
+    各点按 x0 + i*spacing 直接求值（非逐次累加，无累计误差）；末端 x1 若未命中则按序补入。
+    """
+    n = max(1, int((x1 - x0) / spacing) + 1)
+    xs = [round(xv, 6) for xv in _x_grid(x0, spacing, n, x1 + 1e-6)]
+    x_last = round(x1, 6)
+    if x_last not in xs[-2:]:
+        bisect.insort(xs, x_last)
+    return xs
+
+
+def _leg_positions(y_half: float, count: int) -> List[float]:
+    """
+    在 [-y_half, +y_half] 之间等分插入 count 根中间肢，返回其 Y 坐标（不含两端）
+
+    y_i = -y_half + i * (2*y_half / (count+1))，i = 1..count
+    """
+    y_half = float(y_half)
+    step = (2.0 * y_half) / float(count + 1)
+    return [-y_half + float(i) * step for i in range(1, int(count) + 1)]
+
+
+def _sweep_template(x_positions: List[float], points) -> Tuple[Tuple[List, List, List], range]:
+    """
+    将截面模板沿 X 平移展开为原始坐标（不创建 Node/Element）
+
+    坐标按分量分开存放（xs/ys/zs 三个等长列表），第 k 道占下标 [k*K, (k+1)*K)（K=len(points)）。
+    连接关系不逐道展开：各道共用模板 edges，配合返回的起始偏移交给 _bulk_links。
+
+    Returns:
+        ((xs, ys, zs), offsets)
+        - offsets: range(0, K*n, K)，第 k 道节点的起始下标
+    """
+    k = len(points)
+    n = len(x_positions)
+    tmpl_ys = [y for y, _ in points]
+    tmpl_zs = [z for _, z in points]
+    # 预分配后按步长切片整列写入（第 i 个模板节点的 X 依次为 x_positions）
+    xs = [0.0] * (k * n)
+    for i in range(k):
+        xs[i::k] = x_positions
+    ys = tmpl_ys * n
+    zs = tmpl_zs * n
+    return (xs, ys, zs), range(0, k * n, k) if k else range(0)
+
+
+@lru_cache(maxsize=256)
+def _rebar_y_positions(section_width: float, count: int,
+                       cover: float, offset: int = 0) -> Tuple[float, ...]:
+    """
+    RebarEngine._calculate_rebar_y_positions 的计算核心（纯函数，按参数缓存）
+
+    同一模型中 (截面宽, 根数, 保护层, 偏移) 只有少数几种组合，返回不可变元组供各处共享。
+    """
+    if count <= 0:
+        return ()
+
+    # 有效宽度（扣除保护层）
+    effective_width = section_width - 2 * cover
+
+    if count == 1:
+        return (0.0,)  # 单根钢筋居中
+
+    # 附加筋避开主筋：用“合并后的等分序列”选取未被主筋占用的位置（保持对称、且不突破保护层）
+    if offset > 0:
+        total = int(count) + int(offset)
+        if total >= 2 and offset >= 2:
+            all_spacing = effective_width / (total - 1)
+            used = {
+                int(round(i * (total - 1) / (offset - 1)))
+                for i in range(offset)
+            }
+            cand = tuple(-effective_width / 2 + i * all_spacing for i in range(total) if i not in used)
+            if len(cand) == count:
+                return cand
+
+    # 多根钢筋等间距分布（默认：端点落在保护层内侧）
+    spacing = effective_width / (count - 1)
+    return tuple(-effective_width / 2 + i * spacing for i in range(count))
+
+
+# 工字型箍筋（ring13）的连接模板：节点下标见 _i_stirrup_template 中的 10 个关键节点
+_I_STIRRUP_EDGE_TMPL = (
+    # 底部横向边（翼缘宽度，从左外到右外）
+    (0, 1), (1, 2), (2, 3),
+    # 外侧短肢（竖向，只在翼缘内）
+    (0, 4), (3, 5),
+    # 【修正】内侧长肢改为分段，确保闭合：下段（翼缘内）
+    (1, 6), (2, 7),
+    # 翼缘顶横向连接（外侧短肢顶连接到内侧肢）
+    (4, 6), (7, 5),
+    # 顶部横向边（腹板宽度）
+    (8, 9),
+    # 内侧长肢上段（腹板内）
+    (6, 8), (7, 9),
+)
+# 翼缘顶贯通边（仅左右下翼缘顶标高一致时添加）
+_I_STIRRUP_E13 = (4, 5)
+# 4 节点闭合矩形环：节点顺序 左下/右下/右上/左上
+_RECT_RING_EDGES = ((0, 1), (1, 2), (2, 3), (3, 0))
+# 上翼缘闭合环：节点顺序 左下/右下/左上/右上（底边 -> 右竖边 -> 顶边 -> 左竖边）
+_UPPER_RING_EDGES = ((0, 1), (1, 3), (3, 2), (2, 0))
+
+
+@lru_cache(maxsize=None)
+def _ladder_ring_edges(k: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    k 肢矩形环（小梁箍筋）的连接模板：节点为底部 k 个肢点 + 顶部 k 个肢点
+
+    边顺序：底部横向分段 -> 顶部横向分段 -> 竖向肢；肢数只有少数几种，按 k 缓存。
+    """
+    return (tuple((i, i + 1) for i in range(k - 1))
+            + tuple((k + i, k + i + 1) for i in range(k - 1))
+            + tuple((i, k + i) for i in range(k)))
+
+
+def _symmetric_leg_ys(y_half: float, legs: int) -> List[float]:
+    """
+    对称布置的箍筋肢 Y 坐标：两端 ±y_half，中间等分 (legs-2) 根（中间肢坐标保留 6 位小数）
+
+    legs<=2 或 y_half 过小时仅返回两端。
+    """
+    if legs <= 2 or y_half <= 1e-6:
+        return [-y_half, y_half]
+    mids = _leg_positions(y_half, legs - 2)
+    return [float(-y_half)] + [float(round(v, 6)) for v in mids] + [float(y_half)]
+
+
+# 截面尺寸（已统一转为 float，缺省/None 记 0.0）
+GeomF = namedtuple('GeomF', 'H Tw bf_lu bf_ru tf_lu tf_ru bf_ll bf_rl tf_ll tf_rl t_cast_cap h_pre')
+
 
 class RebarEngine:
     # 为避免钢筋与洞口/几何边界“完全重合”导致网格/拾取异常，给洞口相关钢筋做最小偏移
@@ -57,17 +367,51 @@ class RebarEngine:
         """
         self.geometry = geometry
 
+    @property
+    def geometry(self) -> GeometryParams:
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry: GeometryParams) -> None:
+        self._geometry = geometry
+        self._geom_f = None
+        self._upper_ring_cache = {}
+        self._stirrup_template_cache = {}
+
+    @property
+    def _geom_cache(self) -> GeomF:
+        """
+        截面尺寸的 float 快照（懒计算；重新赋值 self.geometry 时失效）
+
+        箍筋/洞口补强热路径里反复出现 float(getattr(g, "...", 0.0) or 0.0)，统一在此只算一次。
+        """
+        gf = self._geom_f
+        if gf is None:
+            g = self._geometry
+            gf = self._geom_f = GeomF(*(float(getattr(g, k, 0.0) or 0.0) for k in GeomF._fields))
+        return gf
+
     @staticmethod
     def _tag_elements_diameter(elements: List, diameter: float) -> None:
+        """
+        为一批单元统一标注直径：直径只校验/转换一次，之后逐个直接赋值（无法转换时不标注）
+
+        真实 PyPCAE 的 Element 为绑定类型，可能不允许附加属性：先对首个单元试写，
+        失败则整批跳过标注（同一批单元类型一致），不中断建模。
+        """
+        if not elements:
+            return
         try:
             d = float(diameter)
         except Exception:
             return
-        for e in elements or []:
-            try:
-                setattr(e, "diameter", d)
-            except Exception:
-                pass
+        it = iter(elements)
+        try:
+            next(it).diameter = d
+        except Exception:
+            return
+        for e in it:
+            e.diameter = d
 
     def _effective_hp(self) -> float:
         """
@@ -76,20 +420,17 @@ class RebarEngine:
         当存在上翼缘且设置了 t_cast_cap>0 时，hp = H - t_cast_cap；
         否则回退到 Excel 的 h_pre。
         """
-        g = self.geometry
-        try:
-            H = float(g.H)
-            bf_upper = max(float(getattr(g, "bf_lu", 0.0) or 0.0), float(getattr(g, "bf_ru", 0.0) or 0.0))
-            tf_upper = max(float(getattr(g, "tf_lu", 0.0) or 0.0), float(getattr(g, "tf_ru", 0.0) or 0.0))
-            if bf_upper > 1e-6 and tf_upper > 1e-6:
-                t_cast_cap = float(getattr(g, "t_cast_cap", 0.0) or 0.0)
-                if t_cast_cap > 1e-6:
-                    t_cast_cap = max(1.0, t_cast_cap)
-                    t_cast_cap = min(t_cast_cap, tf_upper - 1.0)
-                    return H - t_cast_cap
-        except Exception:
-            pass
-        return float(getattr(g, "h_pre", 0.0) or 0.0)
+        # 尺寸已由 GeometryParams 校验、由 _geom_cache 统一转为 float，此处不再逐项兜底
+        gf = self._geom_cache
+        bf_upper = max(gf.bf_lu, gf.bf_ru)
+        tf_upper = max(gf.tf_lu, gf.tf_ru)
+        if bf_upper > 1e-6 and tf_upper > 1e-6:
+            t_cast_cap = gf.t_cast_cap
+            if t_cast_cap > 1e-6:
+                t_cast_cap = max(1.0, t_cast_cap)
+                t_cast_cap = min(t_cast_cap, tf_upper - 1.0)
+                return gf.H - t_cast_cap
+        return gf.h_pre
 
     def create_longitudinal_rebars(self, long_rebar: LongitudinalRebar,
                                    cover: float = 25.0,
@@ -115,8 +456,9 @@ class RebarEngine:
 
         # 【关键】翼缘厚度，底筋要在翼缘以上
         tf = max(self.geometry.tf_ll, self.geometry.tf_rl, 100.0)  # 默认100mm
-        bf_upper = max(float(getattr(self.geometry, "bf_lu", 0.0) or 0.0), float(getattr(self.geometry, "bf_ru", 0.0) or 0.0))
-        bf_lower = max(float(getattr(self.geometry, "bf_ll", 0.0) or 0.0), float(getattr(self.geometry, "bf_rl", 0.0) or 0.0))
+        gf = self._geom_cache
+        bf_upper = max(gf.bf_lu, gf.bf_ru)
+        bf_lower = max(gf.bf_ll, gf.bf_rl)
         top_width = (Tw + 2 * bf_upper) if bf_upper > 1e-6 else Tw
         bottom_width = (Tw + 2 * bf_lower) if bf_lower > 1e-6 else Tw
 
@@ -136,11 +478,12 @@ class RebarEngine:
         all_nodes.extend(top_rebars_result['nodes'])
         all_elements.extend(top_rebars_result['elements'])
         top_rebars.extend(top_rebars_result['elements'])
-        top_through = list(top_rebars_result.get('through', []) or [])
-        top_left_support_A = list(top_rebars_result.get('left_A', []) or [])
-        top_left_support_B = list(top_rebars_result.get('left_B', []) or [])
-        top_right_support_A = list(top_rebars_result.get('right_A', []) or [])
-        top_right_support_B = list(top_rebars_result.get('right_B', []) or [])
+        # 分组列表由 _create_top_rebars 新建且不再被修改，直接沿用，不再逐组复制
+        top_through = top_rebars_result['through']
+        top_left_support_A = top_rebars_result['left_A']
+        top_left_support_B = top_rebars_result['left_B']
+        top_right_support_A = top_rebars_result['right_A']
+        top_right_support_B = top_rebars_result['right_B']
 
         # 1B. 上翼缘角部纵筋自动补齐（至少两根角筋，避免只在腹板范围布筋）
         top_corner_auto = []
@@ -168,8 +511,8 @@ class RebarEngine:
         all_nodes.extend(bottom_rebars_result['nodes'])
         all_elements.extend(bottom_rebars_result['elements'])
         bottom_rebars.extend(bottom_rebars_result['elements'])
-        bottom_through_A = list(bottom_rebars_result.get('through_A', []) or [])
-        bottom_through_B = list(bottom_rebars_result.get('through_B', []) or [])
+        bottom_through_A = bottom_rebars_result['through_A']
+        bottom_through_B = bottom_rebars_result['through_B']
 
         # 2B. 底部翼缘顶部角部纵筋（z=tf_lower-cover）：角点至少有钢筋（客户反馈）
         # 2B. 底部翼缘顶部角部纵筋仅适用于存在下翼缘的截面
@@ -222,21 +565,16 @@ class RebarEngine:
             spacing: 净距(mm)，中心距采用 (dia + spacing)
             diameter: 钢筋直径(mm)
             direction: +1 向上叠排；-1 向下叠排
+
+        注：rows/spacing 已由 LongitudinalRebar 校验（rows>=1, spacing>=0），此处不再逐项兜底。
         """
-        try:
-            n = max(1, int(rows))
-        except Exception:
-            n = 1
-        try:
-            sp = max(0.0, float(spacing))
-        except Exception:
-            sp = 0.0
-        try:
-            d = max(0.0, float(diameter))
-        except Exception:
-            d = 0.0
+        n = max(1, int(rows))
+        sp = max(0.0, float(spacing))
+        d = max(0.0, float(diameter))
         step = (d + sp) if d > 1e-6 else sp
-        return [float(base_z) + float(direction) * float(i) * float(step) for i in range(n)]
+        z0 = float(base_z)
+        dz = float(direction) * step
+        return [z0 + dz * i for i in range(n)]
 
     def _create_top_rebars(self, long_rebar: LongitudinalRebar,
                           L: float, H: float, section_width: float, cover: float,
@@ -259,8 +597,6 @@ class RebarEngine:
         Returns:
             {'nodes': [], 'elements': []}
         """
-        nodes = []
-        elements = []
         # 证据化分组（用于验收：通长筋 vs 支座附加筋独立）
         through = []
         left_A = []
@@ -271,119 +607,45 @@ class RebarEngine:
         # 顶部钢筋 Z 坐标（距顶面 cover）；支持多排叠排（向下）
         z_top_base = H - cover
 
-        # 1) 顶部通长筋（全跨）
-        z_top_list_through = self._stacked_zs(
-            base_z=z_top_base,
-            rows=getattr(long_rebar, "top_rows", 1),
-            spacing=getattr(long_rebar, "top_row_spacing", 0.0),
-            diameter=float(long_rebar.mid_span_top.diameter),
-            direction=-1,
-        )
-        for z_top in z_top_list_through:
-            through_nodes, through_elems = self._create_rebar_line(
-                x_start=0, x_end=L,
-                z=z_top, y_positions=self._calculate_rebar_y_positions(
-                    section_width, long_rebar.mid_span_top.count, cover
-                ),
-                diameter=long_rebar.mid_span_top.diameter,
-                holes=holes
-            )
-            nodes.extend(through_nodes)
-            elements.extend(through_elems)
-            through.extend(through_elems)
+        # 先汇总各组各排钢筋 (分组, (x_start, x_end, z, y_positions, diameter))，再一次批量生成
+        bundles = []
 
-        # 2) 左支座附加筋
-        if getattr(long_rebar, "left_support_top_A", None):
-            z_top_list_la = self._stacked_zs(
+        def _add_rows(group: List, spec, x_start: float, x_end: float, offset: int = 0) -> None:
+            z_list = self._stacked_zs(
                 base_z=z_top_base,
                 rows=getattr(long_rebar, "top_rows", 1),
                 spacing=getattr(long_rebar, "top_row_spacing", 0.0),
-                diameter=float(long_rebar.left_support_top_A.diameter),
+                diameter=float(spec.diameter),
                 direction=-1,
             )
-            for z_top in z_top_list_la:
-                left_a_nodes, left_a_elems = self._create_rebar_line(
-                    x_start=0, x_end=left_len,
-                    z=z_top, y_positions=self._calculate_rebar_y_positions(
-                        section_width, long_rebar.left_support_top_A.count, cover
-                    ),
-                    diameter=long_rebar.left_support_top_A.diameter,
-                    holes=holes
-                )
-                nodes.extend(left_a_nodes)
-                elements.extend(left_a_elems)
-                left_A.extend(left_a_elems)
+            y_positions = self._calculate_rebar_y_positions(section_width, spec.count, cover, offset=offset)
+            for z_top in z_list:
+                bundles.append((group, (x_start, x_end, z_top, y_positions, spec.diameter)))
+
+        # 1) 顶部通长筋（全跨）
+        _add_rows(through, long_rebar.mid_span_top, 0, L)
+
+        # 2) 左支座附加筋
+        if getattr(long_rebar, "left_support_top_A", None):
+            _add_rows(left_A, long_rebar.left_support_top_A, 0, left_len)
 
         # 左支座 B 组（附加筋，如果有）
         if long_rebar.left_support_top_B:
             extend_len = long_rebar.left_support_top_B.extend_length
-            z_top_list_b = self._stacked_zs(
-                base_z=z_top_base,
-                rows=getattr(long_rebar, "top_rows", 1),
-                spacing=getattr(long_rebar, "top_row_spacing", 0.0),
-                diameter=float(long_rebar.left_support_top_B.diameter),
-                direction=-1,
-            )
-            for z_top in z_top_list_b:
-                left_b_nodes, left_b_elems = self._create_rebar_line(
-                    x_start=0, x_end=min(left_len + extend_len, L),
-                    z=z_top, y_positions=self._calculate_rebar_y_positions(
-                        section_width, long_rebar.left_support_top_B.count, cover,
-                        offset=(long_rebar.left_support_top_A.count if getattr(long_rebar, "left_support_top_A", None) else 0)
-                    ),
-                    diameter=long_rebar.left_support_top_B.diameter,
-                    holes=holes
-                )
-                nodes.extend(left_b_nodes)
-                elements.extend(left_b_elems)
-                left_B.extend(left_b_elems)
+            _add_rows(left_B, long_rebar.left_support_top_B, 0, min(left_len + extend_len, L),
+                      offset=(long_rebar.left_support_top_A.count if getattr(long_rebar, "left_support_top_A", None) else 0))
 
         # 3) 右支座附加筋
         if getattr(long_rebar, "right_support_top_A", None):
-            z_top_list_ra = self._stacked_zs(
-                base_z=z_top_base,
-                rows=getattr(long_rebar, "top_rows", 1),
-                spacing=getattr(long_rebar, "top_row_spacing", 0.0),
-                diameter=float(long_rebar.right_support_top_A.diameter),
-                direction=-1,
-            )
-            for z_top in z_top_list_ra:
-                right_a_nodes, right_a_elems = self._create_rebar_line(
-                    x_start=L - right_len, x_end=L,
-                    z=z_top, y_positions=self._calculate_rebar_y_positions(
-                        section_width, long_rebar.right_support_top_A.count, cover
-                    ),
-                    diameter=long_rebar.right_support_top_A.diameter,
-                    holes=holes
-                )
-                nodes.extend(right_a_nodes)
-                elements.extend(right_a_elems)
-                right_A.extend(right_a_elems)
+            _add_rows(right_A, long_rebar.right_support_top_A, L - right_len, L)
 
         # 右支座 B 组（附加筋，如果有）
         if long_rebar.right_support_top_B:
             extend_len = long_rebar.right_support_top_B.extend_length
-            z_top_list_rb = self._stacked_zs(
-                base_z=z_top_base,
-                rows=getattr(long_rebar, "top_rows", 1),
-                spacing=getattr(long_rebar, "top_row_spacing", 0.0),
-                diameter=float(long_rebar.right_support_top_B.diameter),
-                direction=-1,
-            )
-            for z_top in z_top_list_rb:
-                right_b_nodes, right_b_elems = self._create_rebar_line(
-                    x_start=max(L - right_len - extend_len, 0), x_end=L,
-                    z=z_top, y_positions=self._calculate_rebar_y_positions(
-                        section_width, long_rebar.right_support_top_B.count, cover,
-                        offset=(long_rebar.right_support_top_A.count if getattr(long_rebar, "right_support_top_A", None) else 0)
-                    ),
-                    diameter=long_rebar.right_support_top_B.diameter,
-                    holes=holes
-                )
-                nodes.extend(right_b_nodes)
-                elements.extend(right_b_elems)
-                right_B.extend(right_b_elems)
+            _add_rows(right_B, long_rebar.right_support_top_B, max(L - right_len - extend_len, 0), L,
+                      offset=(long_rebar.right_support_top_A.count if getattr(long_rebar, "right_support_top_A", None) else 0))
 
+        nodes, elements = self._emit_rebar_bundles(bundles, holes)
         return {
             'nodes': nodes,
             'elements': elements,
@@ -394,6 +656,26 @@ class RebarEngine:
             'right_B': right_B,
         }
 
+    def _emit_rebar_bundles(self, bundles, holes: List[HoleParams] = None,
+                            num_segments: int = 30) -> Tuple[List, List]:
+        """
+        一次批量生成汇总好的各组钢筋，并把单元归入各自分组
+
+        Args:
+            bundles: [(分组列表, (x_start, x_end, z, y_positions, diameter)), ...]
+
+        Returns:
+            ([Node列表], [Element列表])（按 bundles 顺序拼接）
+        """
+        nodes = []
+        elements = []
+        results = self._create_rebar_lines_batch([b for _, b in bundles], num_segments=num_segments, holes=holes)
+        for (group, _), (bundle_nodes, bundle_elems) in zip(bundles, results):
+            nodes.extend(bundle_nodes)
+            elements.extend(bundle_elems)
+            group.extend(bundle_elems)
+        return nodes, elements
+
     def _create_bottom_rebars(self, long_rebar: LongitudinalRebar,
                              L: float, H: float, Tw: float, cover: float, tf: float,
                              holes: List[HoleParams] = None) -> Dict:
@@ -409,8 +691,6 @@ class RebarEngine:
         Returns:
             {'nodes': [], 'elements': []}
         """
-        nodes = []
-        elements = []
         through_A = []
         through_B = []
 
@@ -420,59 +700,39 @@ class RebarEngine:
         # 【关键修正】底筋分布在翼缘总宽内，不是腹板宽
         # 翼缘总宽 = Tw + 2*bf
         # 翼缘伸出宽度：必须使用几何参数本身，不能用“200mm 默认值”覆盖（否则会把底筋放到混凝土外）
-        bf = max(self.geometry.bf_ll, self.geometry.bf_rl, 0.0)
+        gf = self._geom_cache
+        bf = max(gf.bf_ll, gf.bf_rl, 0.0)
         flange_width = Tw + 2 * bf  # 翼缘总宽（如 250+2*200=650mm）
 
-        # 底部 A 组（通长，从0到L，Y分布在翼缘总宽内）
-        z_bottom_list_a = self._stacked_zs(
-            base_z=z_bottom_base,
-            rows=getattr(long_rebar, "bottom_rows", 1),
-            spacing=getattr(long_rebar, "bottom_row_spacing", 0.0),
-            diameter=float(long_rebar.bottom_through_A.diameter),
-            direction=+1,
-        )
-        for z_bottom in z_bottom_list_a:
-            bottom_a_nodes, bottom_a_elems = self._create_rebar_line(
-                x_start=0, x_end=L,
-                z=z_bottom, y_positions=self._calculate_rebar_y_positions(
-                    flange_width, long_rebar.bottom_through_A.count, cover
-                ),
-                diameter=long_rebar.bottom_through_A.diameter,
-                holes=holes
-            )
-            nodes.extend(bottom_a_nodes)
-            elements.extend(bottom_a_elems)
-            through_A.extend(bottom_a_elems)
+        # 先汇总各组各排钢筋，再一次批量生成（同 _create_top_rebars）
+        bundles = []
 
-        # 底部 B 组（如果有，也是通长，Y分布在翼缘总宽内）
-        if long_rebar.bottom_through_B and long_rebar.bottom_through_B.count > 0:
-            z_bottom_list_b = self._stacked_zs(
+        def _add_rows(group: List, spec, offset: int = 0) -> None:
+            z_list = self._stacked_zs(
                 base_z=z_bottom_base,
                 rows=getattr(long_rebar, "bottom_rows", 1),
                 spacing=getattr(long_rebar, "bottom_row_spacing", 0.0),
-                diameter=float(long_rebar.bottom_through_B.diameter),
+                diameter=float(spec.diameter),
                 direction=+1,
             )
-            for z_bottom in z_bottom_list_b:
-                bottom_b_nodes, bottom_b_elems = self._create_rebar_line(
-                    x_start=0, x_end=L,
-                    z=z_bottom, y_positions=self._calculate_rebar_y_positions(
-                        flange_width, long_rebar.bottom_through_B.count, cover,
-                        offset=long_rebar.bottom_through_A.count
-                    ),
-                    diameter=long_rebar.bottom_through_B.diameter,
-                    holes=holes
-                )
-                nodes.extend(bottom_b_nodes)
-                elements.extend(bottom_b_elems)
-                through_B.extend(bottom_b_elems)
+            y_positions = self._calculate_rebar_y_positions(flange_width, spec.count, cover, offset=offset)
+            for z_bottom in z_list:
+                bundles.append((group, (0, L, z_bottom, y_positions, spec.diameter)))
+
+        # 底部 A 组（通长，从0到L，Y分布在翼缘总宽内）
+        _add_rows(through_A, long_rebar.bottom_through_A)
+
+        # 底部 B 组（如果有，也是通长，Y分布在翼缘总宽内）
+        if long_rebar.bottom_through_B and long_rebar.bottom_through_B.count > 0:
+            _add_rows(through_B, long_rebar.bottom_through_B, offset=long_rebar.bottom_through_A.count)
 
+        nodes, elements = self._emit_rebar_bundles(bundles, holes)
         return {'nodes': nodes, 'elements': elements, 'through_A': through_A, 'through_B': through_B}
 
     def _calculate_rebar_y_positions(self, section_width: float, count: int,
-                                     cover: float, offset: int = 0) -> List[float]:
+                                     cover: float, offset: int = 0) -> Tuple[float, ...]:
         """
-        计算钢筋在 Y 方向的位置
+        计算钢筋在 Y 方向的位置（结果按参数缓存，返回共享的只读元组）
 
         Args:
             section_width: 截面宽度
@@ -481,36 +741,9 @@ class RebarEngine:
             offset: 偏移根数（用于附加筋避开主筋位置）
 
         Returns:
-            [Y 坐标列表]
+            (Y 坐标, ...)
         """
-        if count <= 0:
-            return []
-
-        # 有效宽度（扣除保护层）
-        effective_width = section_width - 2 * cover
-
-        if count == 1:
-            return [0.0]  # 单根钢筋居中
-
-        # 多根钢筋等间距分布（默认：端点落在保护层内侧）
-        spacing = effective_width / (count - 1)
-        y_positions = [-effective_width / 2 + i * spacing for i in range(count)]
-
-        # 附加筋避开主筋：用“合并后的等分序列”选取未被主筋占用的位置（保持对称、且不突破保护层）
-        if offset > 0:
-            total = int(count) + int(offset)
-            if total >= 2 and offset >= 2:
-                all_spacing = effective_width / (total - 1)
-                all_pos = [-effective_width / 2 + i * all_spacing for i in range(total)]
-                used = {
-                    int(round(i * (total - 1) / (offset - 1)))
-                    for i in range(offset)
-                }
-                cand = [all_pos[i] for i in range(total) if i not in used]
-                if len(cand) == count:
-                    y_positions = cand
-
-        return y_positions
+        return _rebar_y_positions(section_width, count, cover, offset)
 
     def _create_rebar_line(self, x_start: float, x_end: float,
                           z: float, y_positions: List[float],
@@ -529,64 +762,100 @@ class RebarEngine:
         Returns:
             ([Node列表], [Element列表])
         """
-        nodes = []
-        elements = []
+        return self._create_rebar_lines_batch(
+            [(x_start, x_end, z, y_positions, diameter)], num_segments=num_segments, holes=holes
+        )[0]
 
-        # 洞口避让：钢筋不得穿过洞口真空区域（hole_void 内不允许出现任何钢筋线段）
-        Tw = float(getattr(self.geometry, "Tw", 0.0) or 0.0)
+    def _create_rebar_lines_batch(self, bundles, num_segments: int = 30,
+                                  holes: List[HoleParams] = None) -> List[Tuple[List, List]]:
+        """
+        批量创建多组平行钢筋（同一面的通长筋/支座筋等一次生成）
+
+        Args:
+            bundles: [(x_start, x_end, z, y_positions, diameter), ...]
+            num_segments: 每根钢筋分段数
+            holes: 洞口列表（钢筋线段避让洞口真空区）
+
+        Returns:
+            [([Node列表], [Element列表]), ...]，与 bundles 一一对应；
+            节点按 bundles 顺序、组内按根连续排列，与逐组调用 _create_rebar_line 的顺序一致。
+        """
+        hole_spans = self._hole_void_spans(holes)
+        pairs = _segment_pairs(num_segments)
+
+        # 先汇总全部组的坐标列，一次创建全部节点；组内第 k 根钢筋占下标 [start+k*m, start+(k+1)*m)
+        xs: List[float] = []
+        ys: List[float] = []
+        zs: List[float] = []
+        plans = []
+        for x_start, x_end, z, y_positions, diameter in bundles:
+            x_points = [x_start + i * (x_end - x_start) / num_segments
+                        for i in range(num_segments + 1)]
+            m = len(x_points)
+            n = len(y_positions)
+            start = len(xs)
+            xs.extend(x_points * n)
+            ys.extend([y for y in y_positions for _ in range(m)])
+            zs.extend([z] * (m * n))
+            rebar_pairs = self._rebar_segment_pairs(x_points, z, y_positions, pairs, hole_spans)
+            plans.append((start, m, n, rebar_pairs, diameter))
+        nodes, ids = _bulk_nodes(xs, ys, zs)
+
+        results = []
+        for start, m, n, rebar_pairs, diameter in plans:
+            if rebar_pairs is None:
+                # 无需避让：各根钢筋共用同一分段连接表
+                elements = _bulk_links(ids, pairs, range(start, start + m * n, m))
+            else:
+                elements = []
+                for k, rp in enumerate(rebar_pairs):
+                    elements.extend(_bulk_links(ids, rp, (start + k * m,)))
+            self._tag_elements_diameter(elements, diameter)
+            results.append((nodes[start:start + m * n], elements))
+        return results
+
+    def _hole_void_spans(self, holes: List[HoleParams]) -> List[Tuple[float, float, float, float]]:
+        """洞口真空区（四周外扩 HOLE_EDGE_CLEARANCE）：[(x0, x1, z0, z1), ...]，无法取边界的洞口跳过"""
         hole_pad = float(getattr(self, "HOLE_EDGE_CLEARANCE", 2.0) or 2.0)
         hole_spans = []
-        if holes:
-            for h in holes:
-                try:
-                    x0, x1, z0, z1 = h.get_bounds()
-                    hole_spans.append((float(x0) - hole_pad, float(x1) + hole_pad,
-                                       float(z0) - hole_pad, float(z1) + hole_pad))
-                except Exception:
-                    continue
+        for h in holes or []:
+            try:
+                x0, x1, z0, z1 = h.get_bounds()
+                hole_spans.append((float(x0) - hole_pad, float(x1) + hole_pad,
+                                   float(z0) - hole_pad, float(z1) + hole_pad))
+            except Exception:
+                continue
+        return hole_spans
 
-        def _seg_hits_hole(xa: float, xb: float, yv: float, zv: float) -> bool:
-            if not hole_spans:
-                return False
-            # 洞口贯通腹板厚度（Y方向），仅需判断该筋是否落在腹板厚度范围内
-            if Tw <= 1e-6 or abs(float(yv)) > (Tw / 2.0 - 1e-6):
-                return False
-            for hx0, hx1, hz0, hz1 in hole_spans:
-                # 纵筋为常Z线：只要其 z 落在洞口高度范围内，即视为穿洞
-                if float(zv) <= hz0 + 1e-6 or float(zv) >= hz1 - 1e-6:
-                    continue
-                lo = min(float(xa), float(xb))
-                hi = max(float(xa), float(xb))
-                if hi > hx0 + 1e-6 and lo < hx1 - 1e-6:
-                    return True
-            return False
-
-        # 计算X方向分段点
-        x_points = [x_start + i * (x_end - x_start) / num_segments
-                   for i in range(num_segments + 1)]
-
-        for y in y_positions:
-            # 为每根钢筋创建节点
-            rebar_nodes = []
-            for x in x_points:
-                node = Node(x, y, z)
-                nodes.append(node)
-                rebar_nodes.append(node)
-
-            # 创建 Link 单元连接节点
-            for i in range(len(rebar_nodes) - 1):
-                xa = float(rebar_nodes[i].x)
-                xb = float(rebar_nodes[i + 1].x)
-                if _seg_hits_hole(xa, xb, float(y), float(z)):
-                    continue
-                elem = Element([rebar_nodes[i].id, rebar_nodes[i+1].id], etype=EleType.Link)
-                try:
-                    elem.diameter = float(diameter)
-                except Exception:
-                    pass
-                elements.append(elem)
+    def _rebar_segment_pairs(self, x_points: List[float], z: float, y_positions: List[float],
+                             pairs, hole_spans):
+        """
+        各根钢筋需要生成的分段连接表
 
-        return nodes, elements
+        洞口避让：钢筋不得穿过洞口真空区域（hole_void 内不允许出现任何钢筋线段）。
+        Returns:
+            None：全部分段都生成（无洞口或该标高不穿洞）；否则为与 y_positions 对应的连接表列表
+        """
+        if not hole_spans:
+            return None
+        # 纵筋为常Z线：只要其 z 落在洞口高度范围内，即视为可能穿洞；
+        # 穿洞的分段只与 X 有关，对同一标高的各根钢筋相同，先一次求出
+        zv = float(z)
+        x_spans = [(hx0, hx1) for hx0, hx1, hz0, hz1 in hole_spans
+                   if hz0 + 1e-6 < zv < hz1 - 1e-6]
+        blocked = set()
+        for i, j in pairs:
+            lo = min(x_points[i], x_points[j])
+            hi = max(x_points[i], x_points[j])
+            if any(hi > hx0 + 1e-6 and lo < hx1 - 1e-6 for hx0, hx1 in x_spans):
+                blocked.add((i, j))
+        # 洞口贯通腹板厚度（Y方向），仅落在腹板厚度范围内的钢筋需要避让
+        Tw = self._geom_cache.Tw
+        if not blocked or Tw <= 1e-6:
+            return None
+        web_half = Tw / 2.0 - 1e-6
+        web_pairs = [p for p in pairs if p not in blocked]
+        return [web_pairs if abs(float(y)) <= web_half else pairs for y in y_positions]
 
     def create_stirrups(self, stirrup: StirrupParams, holes: List[HoleParams] = None) -> Dict:
         """
@@ -609,10 +878,8 @@ class RebarEngine:
         cover = stirrup.cover
 
         # 【关键】下翼缘参数（左右独立，用于自适应箍筋“外侧短肢”高度）
-        bf_ll = float(getattr(self.geometry, "bf_ll", 0.0) or 0.0)
-        bf_rl = float(getattr(self.geometry, "bf_rl", 0.0) or 0.0)
-        tf_ll = float(getattr(self.geometry, "tf_ll", 0.0) or 0.0)
-        tf_rl = float(getattr(self.geometry, "tf_rl", 0.0) or 0.0)
+        gf = self._geom_cache
+        bf_ll, bf_rl, tf_ll, tf_rl = gf.bf_ll, gf.bf_rl, gf.tf_ll, gf.tf_rl
         bf_lower = max(bf_ll, bf_rl, 0.0)
         # 下翼缘总宽（用于“下翼缘外侧短肢”）
         flange_width_lower = Tw + 2.0 * bf_lower
@@ -630,12 +897,12 @@ class RebarEngine:
         z_flange_top_right = (tf_rl - cover) if (bf_rl > 1e-6 and tf_rl > cover + 1e-6) else z_bottom
         z_top = H - cover                          # 顶部Z=775mm
 
-        # 箍筋高度分段（用于调试输出）
-        print(f">>> 【箍筋参数】Y外侧={y_outer:.1f}mm, Y内侧={y_inner:.1f}mm")
-        print(f">>> 【箍筋参数】Z底={z_bottom:.1f}mm, Z翼缘顶左={z_flange_top_left:.1f}mm, Z翼缘顶右={z_flange_top_right:.1f}mm, Z顶={z_top:.1f}mm")
+        # 箍筋高度分段：与原 print 一样经模块 stdout handler 输出；本 logger 调到 WARNING 即可静默（且不再格式化）
+        log.info(">>> 【箍筋参数】Y外侧=%.1fmm, Y内侧=%.1fmm", y_outer, y_inner)
+        log.info(">>> 【箍筋参数】Z底=%.1fmm, Z翼缘顶左=%.1fmm, Z翼缘顶右=%.1fmm, Z顶=%.1fmm",
+                 z_bottom, z_flange_top_left, z_flange_top_right, z_top)
 
         all_nodes = []
-        all_elements = []
         dense_stirrups = []
         normal_stirrups = []
 
@@ -643,71 +910,46 @@ class RebarEngine:
         # 额外扩大 2mm：避免箍筋恰好落在洞口边界线上（客户反馈：洞口中心不允许钢筋穿过）
         skip_ranges = []
         if holes:
+            pad = float(self.HOLE_EDGE_CLEARANCE)
             for h in holes:
                 try:
                     x_min, x_max, _z0, _z1 = h.get_bounds()
-                    pad = float(self.HOLE_EDGE_CLEARANCE)
                     skip_ranges.append((float(x_min) - pad, float(x_max) + pad))
                 except Exception:
                     continue
 
-        # 1. 创建加密区箍筋（两端）- 工字型
-        # 左端加密区
-        left_dense_result = self._create_i_shaped_stirrup_zone(
-            x_start=cover,
-            x_end=stirrup.dense_zone_length,
-            spacing=stirrup.dense_spacing,
-            y_outer=y_outer,                        # 外侧肢Y=300mm
-            y_inner=y_inner,                        # 内侧肢Y=100mm
-            z_bottom=z_bottom,                      # 25mm
-            z_flange_top_left=z_flange_top_left,    # 左翼缘顶（自适应）
-            z_flange_top_right=z_flange_top_right,  # 右翼缘顶（自适应）
-            z_top=z_top,                            # 775mm
-            legs=stirrup.dense_legs,
-            diameter=stirrup.dense_diameter,
-            skip_ranges=skip_ranges
-        )
-        all_nodes.extend(left_dense_result['nodes'])
-        all_elements.extend(left_dense_result['elements'])
-        dense_stirrups.extend(left_dense_result['elements'])
-
-        # 右端加密区
-        right_dense_result = self._create_i_shaped_stirrup_zone(
-            x_start=L - stirrup.dense_zone_length,
-            x_end=L - cover,
-            spacing=stirrup.dense_spacing,
-            y_outer=y_outer,
-            y_inner=y_inner,
-            z_bottom=z_bottom,
-            z_flange_top_left=z_flange_top_left,
-            z_flange_top_right=z_flange_top_right,
-            z_top=z_top,
-            legs=stirrup.dense_legs,
-            diameter=stirrup.dense_diameter,
-            skip_ranges=skip_ranges
-        )
-        all_nodes.extend(right_dense_result['nodes'])
-        all_elements.extend(right_dense_result['elements'])
-        dense_stirrups.extend(right_dense_result['elements'])
-
-        # 2. 创建非加密区箍筋（跨中）- 工字型
-        normal_result = self._create_i_shaped_stirrup_zone(
-            x_start=stirrup.dense_zone_length,
-            x_end=L - stirrup.dense_zone_length,
-            spacing=stirrup.normal_spacing,
-            y_outer=y_outer,
-            y_inner=y_inner,
-            z_bottom=z_bottom,
-            z_flange_top_left=z_flange_top_left,
-            z_flange_top_right=z_flange_top_right,
-            z_top=z_top,
-            legs=stirrup.normal_legs,
-            diameter=stirrup.normal_diameter,
-            skip_ranges=skip_ranges
+        # 三个区段同形同高，仅 X 范围/间距/肢数/直径不同：按区段表逐段生成，再按所属分组归档
+        # 区段表项：(x_start, x_end, spacing, legs, diameter, 分组列表)
+        zones = (
+            # 1. 加密区箍筋（两端）- 工字型：左端、右端
+            (cover, stirrup.dense_zone_length,
+             stirrup.dense_spacing, stirrup.dense_legs, stirrup.dense_diameter, dense_stirrups),
+            (L - stirrup.dense_zone_length, L - cover,
+             stirrup.dense_spacing, stirrup.dense_legs, stirrup.dense_diameter, dense_stirrups),
+            # 2. 非加密区箍筋（跨中）- 工字型
+            (stirrup.dense_zone_length, L - stirrup.dense_zone_length,
+             stirrup.normal_spacing, stirrup.normal_legs, stirrup.normal_diameter, normal_stirrups),
         )
-        all_nodes.extend(normal_result['nodes'])
-        all_elements.extend(normal_result['elements'])
-        normal_stirrups.extend(normal_result['elements'])
+        for x_start, x_end, spacing, legs, diameter, group in zones:
+            zone_nodes, zone_elems = self._create_i_shaped_stirrup_zone(
+                x_start=x_start,
+                x_end=x_end,
+                spacing=spacing,
+                y_outer=y_outer,                        # 外侧肢Y=300mm
+                y_inner=y_inner,                        # 内侧肢Y=100mm
+                z_bottom=z_bottom,                      # 25mm
+                z_flange_top_left=z_flange_top_left,    # 左翼缘顶（自适应）
+                z_flange_top_right=z_flange_top_right,  # 右翼缘顶（自适应）
+                z_top=z_top,                            # 775mm
+                legs=legs,
+                diameter=diameter,
+                skip_ranges=skip_ranges
+            )
+            all_nodes.extend(zone_nodes)
+            group.extend(zone_elems)
+
+        # 区段表按“加密区(左、右) -> 非加密区”排列：全部单元即两组依次拼接，无需在循环中再逐段累加一份
+        all_elements = dense_stirrups + normal_stirrups
 
         return {
             'dense_stirrups': dense_stirrups,
@@ -721,9 +963,9 @@ class RebarEngine:
                                        z_bottom: float, z_flange_top_left: float,
                                        z_flange_top_right: float, z_top: float,
                                        legs: int, diameter: float,
-                                       skip_ranges: List[Tuple[float, float]] = None) -> Dict:
+                                       skip_ranges: List[Tuple[float, float]] = None) -> Tuple[List, List]:
         """
-        创建一个区域内的工字型箍筋
+        创建一个区域内的工字型箍筋（返回 ([Node列表], [Element列表])，由调用方直接并入结果）
 
         Args:
             x_start, x_end: X坐标范围
@@ -737,40 +979,21 @@ class RebarEngine:
             legs: 肢数
             diameter: 直径
         """
-        nodes = []
-        elements = []
+        # 计算箍筋X位置（剔除洞口避让范围）
+        x_positions = _zone_x_positions(x_start, x_end, spacing, tuple(skip_ranges or ()))
 
-        # 计算箍筋X位置
-        num_stirrups = int((x_end - x_start) / spacing) + 1
-        x_positions = [x_start + i * spacing for i in range(num_stirrups)
-                      if x_start + i * spacing <= x_end]
-
-        def _in_skip(xv: float) -> bool:
-            if not skip_ranges:
-                return False
-            for a, b in skip_ranges:
-                if xv >= a - 1e-6 and xv <= b + 1e-6:
-                    return True
-            return False
-
-        for x_pos in x_positions:
-            if _in_skip(x_pos):
-                continue
-            stirrup_nodes, stirrup_elems = self._create_single_i_shaped_stirrup(
-                x=x_pos,
-                y_outer=y_outer,
-                y_inner=y_inner,
-                z_bottom=z_bottom,
-                z_flange_top_left=z_flange_top_left,
-                z_flange_top_right=z_flange_top_right,
-                z_top=z_top,
-                legs=legs,
-                diameter=diameter
-            )
-            nodes.extend(stirrup_nodes)
-            elements.extend(stirrup_elems)
-
-        return {'nodes': nodes, 'elements': elements}
+        # 同一区段内箍筋截面一致：整段一次性批量生成
+        return self._create_i_stirrups_batch(
+            x_positions,
+            y_outer=y_outer,
+            y_inner=y_inner,
+            z_bottom=z_bottom,
+            z_flange_top_left=z_flange_top_left,
+            z_flange_top_right=z_flange_top_right,
+            z_top=z_top,
+            legs=legs,
+            diameter=diameter
+        )
 
     def _create_single_i_shaped_stirrup(self, x: float, y_outer: float, y_inner: float,
                                          z_bottom: float, z_flange_top_left: float,
@@ -796,221 +1019,219 @@ class RebarEngine:
         - 内侧肢（Y=±100）：长，高度 = z_top - z_bottom（贯通全高）
         - 左右翼缘高度可不同（tf_ll vs tf_rl），实现自适应
         """
-        nodes = []
-        elements = []
-
-        # 2肢箍筋：按腹板矩形闭合（不引入外侧短肢/中间横筋）
-        # 无下翼缘（T梁等）：同样退化为腹板矩形闭合箍筋，避免“外侧短肢”越界
-        if int(legs) <= 2 or abs(float(y_outer) - float(y_inner)) <= 1e-6:
-            n1 = Node(x, -y_inner, z_bottom)
-            n2 = Node(x,  y_inner, z_bottom)
-            n3 = Node(x,  y_inner, z_top)
-            n4 = Node(x, -y_inner, z_top)
-            nodes.extend([n1, n2, n3, n4])
-            elements.extend([
-                Element([n1.id, n2.id], etype=EleType.Link),
-                Element([n2.id, n3.id], etype=EleType.Link),
-                Element([n3.id, n4.id], etype=EleType.Link),
-                Element([n4.id, n1.id], etype=EleType.Link),
-            ])
-            self._tag_elements_diameter(elements, diameter)
-
-            # 4肢及以上：添加中间内拉筋（贯通全高）
-            if int(legs) >= 4:
-                inner_leg_count = legs - 2
-                if inner_leg_count > 0:
-                    inner_spacing = (2 * y_inner) / (inner_leg_count + 1)
-                    for i in range(1, inner_leg_count + 1):
-                        y_mid = -y_inner + i * inner_spacing
-                        n_mid_bottom = Node(x, y_mid, z_bottom)
-                        n_mid_top = Node(x, y_mid, z_top)
-                        nodes.extend([n_mid_bottom, n_mid_top])
-                        e_mid = Element([n_mid_bottom.id, n_mid_top.id], etype=EleType.Link)
-                        try:
-                            e_mid.diameter = float(diameter)
-                        except Exception:
-                            pass
-                        elements.append(e_mid)
-
-            # 20260203 客户反馈：非加密区缺少翼缘箍筋
-            # - 即使按“2肢/腹板矩形”退化，也需要在下翼缘范围补一个闭合环，保证洞口范围外翼缘箍筋不缺失。
-            # - 仅在确实存在下翼缘高度（z_flange_top > z_bottom）且 y_outer != y_inner 时启用。
-            try:
-                if abs(float(y_outer) - float(y_inner)) > 1e-6:
-                    zf = min(float(z_flange_top_left), float(z_flange_top_right))
-                    if zf > float(z_bottom) + 1e-6:
-                        f1 = Node(x, -float(y_outer), float(z_bottom))
-                        f2 = Node(x, float(y_outer), float(z_bottom))
-                        f3 = Node(x, float(y_outer), float(zf))
-                        f4 = Node(x, -float(y_outer), float(zf))
-                        nodes.extend([f1, f2, f3, f4])
-                        flange_elems = [
-                            Element([f1.id, f2.id], etype=EleType.Link),
-                            Element([f2.id, f3.id], etype=EleType.Link),
-                            Element([f3.id, f4.id], etype=EleType.Link),
-                            Element([f4.id, f1.id], etype=EleType.Link),
-                        ]
-                        self._tag_elements_diameter(flange_elems, diameter)
-                        elements.extend(flange_elems)
-            except Exception:
-                pass
-
-            # 上翼缘闭合环：仍按原逻辑补齐（若存在上翼缘）
-            try:
-                g = self.geometry
-                H = float(getattr(g, "H", 0.0) or 0.0)
-                Tw = float(getattr(g, "Tw", 0.0) or 0.0)
-                cover_est = Tw / 2.0 - float(y_inner)
-                bf_upper = max(float(getattr(g, "bf_lu", 0.0) or 0.0), float(getattr(g, "bf_ru", 0.0) or 0.0))
-                tf_upper = max(float(getattr(g, "tf_lu", 0.0) or 0.0), float(getattr(g, "tf_ru", 0.0) or 0.0))
-                if bf_upper > 1e-6 and tf_upper > 1e-6 and cover_est > 0:
-                    top_width = (Tw + 2.0 * bf_upper) if bf_upper > 1e-6 else Tw
-                    y_outer_upper = top_width / 2.0 - cover_est
-                    z_upper_bottom = H - tf_upper + cover_est
-                    if y_outer_upper > float(y_inner) + 1e-6 and (z_top - z_upper_bottom) > 1e-6:
-                        u1 = Node(x, -y_outer_upper, z_upper_bottom)
-                        u2 = Node(x, y_outer_upper, z_upper_bottom)
-                        u3 = Node(x, -y_outer_upper, z_top)
-                        u4 = Node(x, y_outer_upper, z_top)
-                        nodes.extend([u1, u2, u3, u4])
-                        _up_elems = [
-                            Element([u1.id, u2.id], etype=EleType.Link),
-                            Element([u2.id, u4.id], etype=EleType.Link),
-                            Element([u4.id, u3.id], etype=EleType.Link),
-                            Element([u3.id, u1.id], etype=EleType.Link),
-                        ]
-                        self._tag_elements_diameter(_up_elems, diameter)
-                        elements.extend(_up_elems)
-            except Exception:
-                pass
-
-            return nodes, elements
-
-        # === 创建10个关键节点 ===
-        # 外侧4个底角（在翼缘底部 Z=z_bottom）
-        n1 = Node(x, -y_outer, z_bottom)    # 左外底 Y=-300
-        n2 = Node(x, -y_inner, z_bottom)    # 左内底 Y=-100
-        n3 = Node(x, y_inner, z_bottom)     # 右内底 Y=+100
-        n4 = Node(x, y_outer, z_bottom)     # 右外底 Y=+300
-
-        # 外侧短肢顶点（左右翼缘顶，高度自适应）
-        n5 = Node(x, -y_outer, z_flange_top_left)   # 左外顶（自适应tf_ll）
-        n6 = Node(x, y_outer, z_flange_top_right)   # 右外顶（自适应tf_rl）
-
-        # 内侧长肢的翼缘顶点（用于水平连接）
-        n7 = Node(x, -y_inner, z_flange_top_left)   # 左内翼缘顶
-        n8 = Node(x, y_inner, z_flange_top_right)   # 右内翼缘顶
+        return self._create_i_stirrups_batch(
+            [x],
+            y_outer=y_outer,
+            y_inner=y_inner,
+            z_bottom=z_bottom,
+            z_flange_top_left=z_flange_top_left,
+            z_flange_top_right=z_flange_top_right,
+            z_top=z_top,
+            legs=legs,
+            diameter=diameter
+        )
 
-        # 内侧长肢顶点（贯通到梁顶）
-        n9 = Node(x, -y_inner, z_top)    # 左内顶 Y=-100
-        n10 = Node(x, y_inner, z_top)    # 右内顶 Y=+100
+    @_profile
+    def _create_i_stirrups_batch(self, x_positions: List[float], y_outer: float, y_inner: float,
+                                 z_bottom: float, z_flange_top_left: float,
+                                 z_flange_top_right: float, z_top: float,
+                                 legs: int, diameter: float) -> Tuple[List, List]:
+        """
+        批量生成一组工字型箍筋（各道截面相同，仅X不同）
 
-        nodes.extend([n1, n2, n3, n4, n5, n6, n7, n8, n9, n10])
+        先由 _sweep_template 一次展开全部坐标（按分量），再按模板连接与各道偏移统一创建 Node/Element；
+        节点按道连续排列：第k道的节点为 nodes[k*K:(k+1)*K]（K为模板节点数）。
 
-        # === 创建箍筋边 ===
-        # 底部横向边（翼缘宽度，从左外到右外）
-        e1 = Element([n1.id, n2.id], etype=EleType.Link)  # 左段底边
-        e2 = Element([n2.id, n3.id], etype=EleType.Link)  # 中段底边
-        e3 = Element([n3.id, n4.id], etype=EleType.Link)  # 右段底边
+        Returns:
+            ([Node列表], [Element列表])
+        """
+        points, edges = self._i_stirrup_template(
+            y_outer=y_outer,
+            y_inner=y_inner,
+            z_bottom=z_bottom,
+            z_flange_top_left=z_flange_top_left,
+            z_flange_top_right=z_flange_top_right,
+            z_top=z_top,
+            legs=legs
+        )
+        (xs, ys, zs), offsets = _sweep_template(x_positions, points)
+        nodes, ids = _bulk_nodes(xs, ys, zs)
+        elements = _bulk_links(ids, edges, offsets)
+        self._tag_elements_diameter(elements, diameter)
+        return nodes, elements
 
-        # 外侧短肢（竖向，只在翼缘内）
-        e4 = Element([n1.id, n5.id], etype=EleType.Link)  # 左外竖边（短）
-        e5 = Element([n4.id, n6.id], etype=EleType.Link)  # 右外竖边（短）
+    def _i_stirrup_template(self, y_outer: float, y_inner: float,
+                            z_bottom: float, z_flange_top_left: float,
+                            z_flange_top_right: float, z_top: float,
+                            legs: int) -> Tuple[List, List]:
+        """
+        工字型箍筋的截面模板（与X无关）
 
-        # 【修正】内侧长肢改为分段，确保闭合
-        # 左内侧肢：下段(n2→n7) + 上段(n7→n9)
-        e6 = Element([n2.id, n7.id], etype=EleType.Link)   # 左内竖边（下段，翼缘内）
-        e11 = Element([n7.id, n9.id], etype=EleType.Link)  # 左内竖边（上段，腹板内）
+        同一区段内各道箍筋只有X不同，节点(Y,Z)与连接关系完全一致；
+        因此模板每个区段只需计算一次，再按X平移生成节点/单元。
+        左右加密区、洞口两侧补强区通常截面参数完全相同，模板按参数缓存在引擎上复用
+        （重新赋值 self.geometry 时清空）。
 
-        # 右内侧肢：下段(n3→n8) + 上段(n8→n10)
-        e7 = Element([n3.id, n8.id], etype=EleType.Link)   # 右内竖边（下段，翼缘内）
-        e12 = Element([n8.id, n10.id], etype=EleType.Link) # 右内竖边（上段，腹板内）
+        Returns:
+            (points, edges)
+            - points: ((y, z), ...) 节点截面坐标（顺序即节点生成顺序）
+            - edges:  ((i, j), ...) 节点下标对，每对对应一个 Link 单元
+        """
+        key = (y_outer, y_inner, z_bottom, z_flange_top_left, z_flange_top_right, z_top, legs)
+        template = self._stirrup_template_cache.get(key)
+        if template is not None:
+            return template
 
-        # 翼缘顶横向连接（外侧短肢顶连接到内侧肢）
-        e8 = Element([n5.id, n7.id], etype=EleType.Link)  # 左翼缘顶横边
-        e9 = Element([n8.id, n6.id], etype=EleType.Link)  # 右翼缘顶横边
+        # 2肢箍筋：按腹板矩形闭合（不引入外侧短肢/中间横筋）
+        # 无下翼缘（T梁等）：同样退化为腹板矩形闭合箍筋，避免“外侧短肢”越界
+        web_rect = int(legs) <= 2 or abs(float(y_outer) - float(y_inner)) <= 1e-6
+        builder = self._web_rect_template if web_rect else self._ring13_template
+        points, edges = builder(y_outer, y_inner, z_bottom, z_flange_top_left,
+                                z_flange_top_right, z_top, legs)
+        # 缓存为只读元组，避免调用方误改共享模板
+        template = self._stirrup_template_cache[key] = (tuple(points), tuple(edges))
+        return template
+
+    def _web_rect_template(self, y_outer: float, y_inner: float,
+                           z_bottom: float, z_flange_top_left: float,
+                           z_flange_top_right: float, z_top: float,
+                           legs: int) -> Tuple[List, List]:
+        """腹板矩形闭合箍筋模板（2肢或无下翼缘），可附加中间内拉筋与上/下翼缘闭合环"""
+        points: List[Tuple[float, float]] = [
+            (-y_inner, z_bottom),
+            (y_inner, z_bottom),
+            (y_inner, z_top),
+            (-y_inner, z_top),
+        ]
+        edges: List[Tuple[int, int]] = list(_RECT_RING_EDGES)
+
+        # 4肢及以上：添加中间内拉筋（贯通全高）
+        if int(legs) >= 4:
+            inner_leg_count = legs - 2
+            for y_mid in _leg_positions(y_inner, inner_leg_count):
+                base = len(points)
+                points.append((y_mid, z_bottom))
+                points.append((y_mid, z_top))
+                edges.append((base, base + 1))
+
+        # 20260203 客户反馈：非加密区缺少翼缘箍筋
+        # - 即使按“2肢/腹板矩形”退化，也需要在下翼缘范围补一个闭合环，保证洞口范围外翼缘箍筋不缺失。
+        # - 仅在确实存在下翼缘高度（z_flange_top > z_bottom）且 y_outer != y_inner 时启用。
+        if abs(float(y_outer) - float(y_inner)) > 1e-6:
+            zf = min(float(z_flange_top_left), float(z_flange_top_right))
+            if zf > float(z_bottom) + 1e-6:
+                base = len(points)
+                points.extend([
+                    (-float(y_outer), float(z_bottom)),
+                    (float(y_outer), float(z_bottom)),
+                    (float(y_outer), float(zf)),
+                    (-float(y_outer), float(zf)),
+                ])
+                edges.extend((base + a, base + b) for a, b in _RECT_RING_EDGES)
+
+        # 上翼缘闭合环：仍按原逻辑补齐（若存在上翼缘）
+        ring = self._upper_flange_ring(y_inner, z_top)
+        if ring:
+            base = len(points)
+            points.extend(ring)
+            edges.extend((base + a, base + b) for a, b in _UPPER_RING_EDGES)
+
+        return points, edges
+
+    def _ring13_template(self, y_outer: float, y_inner: float,
+                         z_bottom: float, z_flange_top_left: float,
+                         z_flange_top_right: float, z_top: float,
+                         legs: int) -> Tuple[List, List]:
+        """工字型 ring13 箍筋模板（存在下翼缘外肢，基础肢数=4）"""
+        # === 10个关键节点 ===
+        points: List[Tuple[float, float]] = [
+            # 外侧4个底角（在翼缘底部 Z=z_bottom）
+            (-y_outer, z_bottom),             # 0 左外底 Y=-300
+            (-y_inner, z_bottom),             # 1 左内底 Y=-100
+            (y_inner, z_bottom),              # 2 右内底 Y=+100
+            (y_outer, z_bottom),              # 3 右外底 Y=+300
+            # 外侧短肢顶点（左右翼缘顶，高度自适应）
+            (-y_outer, z_flange_top_left),    # 4 左外顶（自适应tf_ll）
+            (y_outer, z_flange_top_right),    # 5 右外顶（自适应tf_rl）
+            # 内侧长肢的翼缘顶点（用于水平连接）
+            (-y_inner, z_flange_top_left),    # 6 左内翼缘顶
+            (y_inner, z_flange_top_right),    # 7 右内翼缘顶
+            # 内侧长肢顶点（贯通到梁顶）
+            (-y_inner, z_top),                # 8 左内顶 Y=-100
+            (y_inner, z_top),                 # 9 右内顶 Y=+100
+        ]
+
+        # === 箍筋边 ===
+        edges: List[Tuple[int, int]] = list(_I_STIRRUP_EDGE_TMPL)
+        # 注：不在 z=z_flange_top 处额外添加横向连筋，避免出现“多一条水平钢筋/中间横线”的观感与肢数歧义
 
         # 20260203 客户反馈：加密区翼缘顶部在腹板范围未闭合
         # - 对“左右下翼缘顶标高一致”的情况，在 z=z_flange_top 处补一段贯通翼缘宽度的顶边（E->F），保证翼缘箍筋闭合观感。
         # - 若左右翼缘顶高度不一致（非对称截面），不补这条斜边，避免生成穿越实体外的斜杆。
-        e13 = None
-        try:
-            if abs(float(z_flange_top_left) - float(z_flange_top_right)) <= 1e-6:
-                e13 = Element([n5.id, n6.id], etype=EleType.Link)  # 翼缘顶贯通边
-        except Exception:
-            e13 = None
-
-        # 顶部横向边（腹板宽度）
-        e10 = Element([n9.id, n10.id], etype=EleType.Link)  # 顶边
-
-        # 注：不在 z=z_flange_top 处额外添加横向连筋，避免出现“多一条水平钢筋/中间横线”的观感与肢数歧义
-        base_elems = [e1, e2, e3, e4, e5, e6, e7, e8, e9, e10, e11, e12]
-        if e13 is not None:
-            base_elems.append(e13)
-        elements.extend(base_elems)
-        self._tag_elements_diameter(elements, diameter)
+        if abs(float(z_flange_top_left) - float(z_flange_top_right)) <= 1e-6:
+            edges.append(_I_STIRRUP_E13)  # 翼缘顶贯通边
 
         # === 多肢箍筋：添加中间内肢（避免把 4 肢误生成成 6 肢）===
         # 约定：
         # - 工字/倒T等存在下翼缘外肢时，基础肢数=4（±y_outer 外肢 + ±y_inner 内肢）
-        # - 无下翼缘时退化为腹板矩形，基础肢数=2（±y_inner）
+        # - 无下翼缘时退化为腹板矩形，基础肢数=2（±y_inner），见 _web_rect_template
         # legs 表示“目标总肢数”，不足基础肢数时按基础肢数处理。
-        try:
-            legs_req = int(legs)
-        except Exception:
-            legs_req = 0
-        base_legs = 4 if abs(float(y_outer) - float(y_inner)) > 1e-6 else 2
+        legs_req = int(legs) if legs else 0
+        base_legs = 4
         legs_eff = max(base_legs, legs_req)
         inner_leg_count = max(0, int(legs_eff) - int(base_legs))
         if inner_leg_count > 0 and float(y_inner) > 1e-6:
-            inner_spacing = (2.0 * float(y_inner)) / float(inner_leg_count + 1)
-            for i in range(1, inner_leg_count + 1):
-                y_mid = -float(y_inner) + float(i) * float(inner_spacing)
+            for y_mid in _leg_positions(y_inner, inner_leg_count):
                 # 中间内肢：从底部贯通到顶部（不添加任何中间横向连杆）
-                n_mid_bottom = Node(x, y_mid, z_bottom)
-                n_mid_top = Node(x, y_mid, z_top)
-                nodes.extend([n_mid_bottom, n_mid_top])
-                e_mid = Element([n_mid_bottom.id, n_mid_top.id], etype=EleType.Link)
-                try:
-                    e_mid.diameter = float(diameter)
-                except Exception:
-                    pass
-                elements.append(e_mid)
+                base = len(points)
+                points.append((y_mid, z_bottom))
+                points.append((y_mid, z_top))
+                edges.append((base, base + 1))
 
         # === 20260119 客户反馈：补齐“上部箍筋”（上翼缘范围的闭合环）===
         # 说明：原 ring13 的外侧短肢仅在下翼缘范围内；此处为上翼缘补一个“闭合矩形环”，
         # 仅位于上翼缘厚度范围内（不影响原 ring13 13段自检）。
-        try:
-            g = self.geometry
-            H = float(getattr(g, "H", 0.0) or 0.0)
-            Tw = float(getattr(g, "Tw", 0.0) or 0.0)
-            # 由 y_inner 反推 cover（y_inner = Tw/2 - cover）
-            cover_est = Tw / 2.0 - float(y_inner)
-            bf_upper = max(float(getattr(g, "bf_lu", 0.0) or 0.0), float(getattr(g, "bf_ru", 0.0) or 0.0))
-            tf_upper = max(float(getattr(g, "tf_lu", 0.0) or 0.0), float(getattr(g, "tf_ru", 0.0) or 0.0))
-            if bf_upper > 1e-6 and tf_upper > 1e-6 and cover_est > 0:
-                top_width = (Tw + 2.0 * bf_upper) if bf_upper > 1e-6 else Tw
-                y_outer_upper = top_width / 2.0 - cover_est
-                z_upper_bottom = H - tf_upper + cover_est
-                # 需要至少留出 2*cover 的实体厚度
-                if y_outer_upper > float(y_inner) + 1e-6 and (z_top - z_upper_bottom) > 1e-6:
-                    u1 = Node(x, -y_outer_upper, z_upper_bottom)
-                    u2 = Node(x, y_outer_upper, z_upper_bottom)
-                    u3 = Node(x, -y_outer_upper, z_top)
-                    u4 = Node(x, y_outer_upper, z_top)
-                    nodes.extend([u1, u2, u3, u4])
-                    _up_elems = [
-                        Element([u1.id, u2.id], etype=EleType.Link),  # 上翼缘底边
-                        Element([u2.id, u4.id], etype=EleType.Link),  # 右竖边
-                        Element([u4.id, u3.id], etype=EleType.Link),  # 上翼缘顶边
-                        Element([u3.id, u1.id], etype=EleType.Link),  # 左竖边
-                    ]
-                    self._tag_elements_diameter(_up_elems, diameter)
-                    elements.extend(_up_elems)
-        except Exception:
-            pass
+        ring = self._upper_flange_ring(y_inner, z_top)
+        if ring:
+            base = len(points)
+            points.extend(ring)
+            edges.extend((base + a, base + b) for a, b in _UPPER_RING_EDGES)
 
-        return nodes, elements
+        return points, edges
+
+    def _upper_flange_ring(self, y_inner: float, z_top: float) -> Tuple[Tuple[float, float], ...]:
+        """
+        上翼缘闭合环的 4 个截面节点（左下/右下/左上/右上），无上翼缘或空间不足时返回空元组
+
+        结果只取决于截面尺寸与 (y_inner, z_top)，按参数缓存在引擎上；重新赋值 self.geometry 时清空。
+        """
+        key = (y_inner, z_top)
+        ring = self._upper_ring_cache.get(key)
+        if ring is not None:
+            return ring
+
+        ring = ()
+        gf = self._geom_cache
+        H = gf.H
+        Tw = gf.Tw
+        # 由 y_inner 反推 cover（y_inner = Tw/2 - cover）
+        cover_est = Tw / 2.0 - float(y_inner)
+        bf_upper = max(gf.bf_lu, gf.bf_ru)
+        tf_upper = max(gf.tf_lu, gf.tf_ru)
+        if bf_upper > 1e-6 and tf_upper > 1e-6 and cover_est > 0:
+            top_width = (Tw + 2.0 * bf_upper) if bf_upper > 1e-6 else Tw
+            y_outer_upper = top_width / 2.0 - cover_est
+            z_upper_bottom = H - tf_upper + cover_est
+            # 需要至少留出 2*cover 的实体厚度
+            if y_outer_upper > float(y_inner) + 1e-6 and (z_top - z_upper_bottom) > 1e-6:
+                ring = (
+                    (-y_outer_upper, z_upper_bottom),
+                    (y_outer_upper, z_upper_bottom),
+                    (-y_outer_upper, z_top),
+                    (y_outer_upper, z_top),
+                )
+        self._upper_ring_cache[key] = ring
+        return ring
 
     # ========== 洞口加强筋 ==========
     def create_hole_reinforcement(self, hole, tf_lower: float, cover: float = 25.0) -> Dict:
@@ -1090,55 +1311,43 @@ class RebarEngine:
             # 顶部纵筋：理想位置=洞口顶面上方 cover；若超出梁顶保护层位置，则下压到 H-cover
             z_top_bar_raw = float(z_top) + float(cover)
             z_top_bar_max = float(H) - float(cover)
-            z_top_bar = min(z_top_bar_raw, z_top_bar_max)
+            z_top_bar = z_top_bar_raw if z_top_bar_raw < z_top_bar_max else z_top_bar_max
             # 底部纵筋：理想位置=洞口底面下方 cover；若低于梁底保护层位置，则上抬到 cover
             z_bot_bar_raw = float(z_bottom) - float(cover)
             z_bot_bar_min = float(cover)
-            z_bot_bar = max(z_bot_bar_raw, z_bot_bar_min)
+            z_bot_bar = z_bot_bar_raw if z_bot_bar_raw > z_bot_bar_min else z_bot_bar_min
             if abs(z_top_bar - z_top_bar_raw) > 1e-6:
-                print(f">>> 警告: 洞口顶纵筋标高超出梁顶，已调整: raw={z_top_bar_raw:.1f} -> {z_top_bar:.1f} (H={H:.1f}, cover={cover:.1f})")
+                log.warning(">>> 警告: 洞口顶纵筋标高超出梁顶，已调整: raw=%.1f -> %.1f (H=%.1f, cover=%.1f)",
+                            z_top_bar_raw, z_top_bar, H, cover)
             if abs(z_bot_bar - z_bot_bar_raw) > 1e-6:
-                print(f">>> 警告: 洞口底纵筋标高低于梁底，已调整: raw={z_bot_bar_raw:.1f} -> {z_bot_bar:.1f} (cover={cover:.1f})")
+                log.warning(">>> 警告: 洞口底纵筋标高低于梁底，已调整: raw=%.1f -> %.1f (cover=%.1f)",
+                            z_bot_bar_raw, z_bot_bar, cover)
 
+            # 顶/底纵筋汇总后一次批量生成（Y 在腹板宽内等分，含洞口真空区避让）
+            bundles = []
             if top_long_cnt > 0 and top_long_dia > 0:
-                top_result = self._create_hole_longitudinal_rebars(
-                    x_start=x_left - extend,
-                    x_end=x_right + extend,
-                    z=z_top_bar,  # 洞口顶面上方（必要时下压到梁顶保护层）
-                    y_width=Tw,
-                    count=top_long_cnt,
-                    diameter=top_long_dia,
-                    cover=cover,
-                    holes=[hole]
-                )
-                all_nodes.extend(top_result['nodes'])
-                all_elements.extend(top_result['elements'])
-                top_long_rebars.extend(top_result['elements'])
-
+                bundles.append((top_long_rebars, self._hole_long_bundle(
+                    x_left - extend, x_right + extend,
+                    z_top_bar,  # 洞口顶面上方（必要时下压到梁顶保护层）
+                    Tw, top_long_cnt, top_long_dia, cover)))
             if bot_long_cnt > 0 and bot_long_dia > 0:
-                bottom_result = self._create_hole_longitudinal_rebars(
-                    x_start=x_left - extend,
-                    x_end=x_right + extend,
-                    z=z_bot_bar,  # 洞口底面下方（必要时上抬到梁底保护层）
-                    y_width=Tw,
-                    count=bot_long_cnt,
-                    diameter=bot_long_dia,
-                    cover=cover,
-                    holes=[hole]
-                )
-                all_nodes.extend(bottom_result['nodes'])
-                all_elements.extend(bottom_result['elements'])
-                bottom_long_rebars.extend(bottom_result['elements'])
+                bundles.append((bottom_long_rebars, self._hole_long_bundle(
+                    x_left - extend, x_right + extend,
+                    z_bot_bar,  # 洞口底面下方（必要时上抬到梁底保护层）
+                    Tw, bot_long_cnt, bot_long_dia, cover)))
+            long_nodes, long_elems = self._emit_rebar_bundles(bundles, holes=[hole], num_segments=10)
+            all_nodes.extend(long_nodes)
+            all_elements.extend(long_elems)
 
-            print(f">>> 【洞口补强】顶纵筋: {top_long_cnt}根 x Φ{top_long_dia}, 底纵筋: {bot_long_cnt}根 x Φ{bot_long_dia}, 锚固{extend}mm")
+            log.info(">>> 【洞口补强】顶纵筋: %s根 x Φ%s, 底纵筋: %s根 x Φ%s, 锚固%smm",
+                     top_long_cnt, top_long_dia, bot_long_cnt, bot_long_dia, extend)
 
         # 2. 创建洞口侧边加强箍筋
         if hole.side_stirrup_spacing > 0 and hole.side_stirrup_diameter > 0:
             # 【客户反馈】洞口两侧加强箍筋的高度应与全局箍筋一致：贯通梁顶/梁底
             # 这里采用工字型 ring13 形状（与全局箍筋同形同高），仅在洞口两侧加密范围内生成。
-            bf_ll = float(getattr(self.geometry, "bf_ll", 0.0) or 0.0)
-            bf_rl = float(getattr(self.geometry, "bf_rl", 0.0) or 0.0)
-            bf_lower = max(bf_ll, bf_rl, 0.0)
+            gf = self._geom_cache
+            bf_lower = max(gf.bf_ll, gf.bf_rl, 0.0)
             flange_width_lower = Tw + 2.0 * bf_lower
             y_outer = flange_width_lower / 2.0 - cover if bf_lower > 1e-6 else (Tw / 2.0 - cover)
             y_inner = Tw / 2 - cover
@@ -1149,7 +1358,7 @@ class RebarEngine:
 
             # 左侧补强区
             if hole.left_reinf_length > 0:
-                left_result = self._create_hole_side_i_stirrups(
+                left_nodes, left_elems = self._create_hole_side_i_stirrups(
                     x_start=x_left - hole.left_reinf_length,
                     x_end=x_left - edge_clear,  # 避免与洞口边界重合
                     spacing=hole.side_stirrup_spacing,
@@ -1162,13 +1371,13 @@ class RebarEngine:
                     legs=hole.side_stirrup_legs,
                     diameter=hole.side_stirrup_diameter
                 )
-                all_nodes.extend(left_result['nodes'])
-                all_elements.extend(left_result['elements'])
-                left_stirrups.extend(left_result['elements'])
+                all_nodes.extend(left_nodes)
+                all_elements.extend(left_elems)
+                left_stirrups.extend(left_elems)
 
             # 右侧补强区
             if hole.right_reinf_length > 0:
-                right_result = self._create_hole_side_i_stirrups(
+                right_nodes, right_elems = self._create_hole_side_i_stirrups(
                     x_start=x_right + edge_clear,  # 避免与洞口边界重合
                     x_end=x_right + hole.right_reinf_length,
                     spacing=hole.side_stirrup_spacing,
@@ -1181,17 +1390,18 @@ class RebarEngine:
                     legs=hole.side_stirrup_legs,
                     diameter=hole.side_stirrup_diameter
                 )
-                all_nodes.extend(right_result['nodes'])
-                all_elements.extend(right_result['elements'])
-                right_stirrups.extend(right_result['elements'])
+                all_nodes.extend(right_nodes)
+                all_elements.extend(right_elems)
+                right_stirrups.extend(right_elems)
 
-            print(f">>> 【洞口补强】侧边箍筋: 左{hole.left_reinf_length}mm + 右{hole.right_reinf_length}mm, 间距{hole.side_stirrup_spacing}mm")
+            log.info(">>> 【洞口补强】侧边箍筋: 左%smm + 右%smm, 间距%smm",
+                     hole.left_reinf_length, hole.right_reinf_length, hole.side_stirrup_spacing)
 
         # 3. 洞顶/洞底小梁箍筋（沿 X 方向 @spacing，补齐洞口两端）
         if hole.small_beam_stirrup_spacing > 0 and hole.small_beam_stirrup_diameter > 0:
             try:
                 sb_legs = int(getattr(hole, "small_beam_stirrup_legs", 0) or 0)
-            except Exception:
+            except (TypeError, ValueError, OverflowError):
                 sb_legs = 0
             if sb_legs <= 0:
                 sb_legs = 4
@@ -1201,15 +1411,16 @@ class RebarEngine:
                 z_top=z_top,
                 z_bottom=z_bottom,
                 y_width=Tw,
-                spacing=float(hole.small_beam_stirrup_spacing),
-                diameter=float(hole.small_beam_stirrup_diameter),
+                spacing=hole.small_beam_stirrup_spacing,
+                diameter=hole.small_beam_stirrup_diameter,
                 cover=cover,
-                H=float(H),
-                legs=int(sb_legs),
+                H=H,
+                legs=sb_legs,
                 edge_clear=edge_clear
             )
             all_nodes.extend(sb_nodes)
-            all_elements.extend(sb_elems_top + sb_elems_bot)
+            all_elements.extend(sb_elems_top)
+            all_elements.extend(sb_elems_bot)
             top_beam_stirrups.extend(sb_elems_top)
             bottom_beam_stirrups.extend(sb_elems_bot)
 
@@ -1224,6 +1435,7 @@ class RebarEngine:
             'all_elements': all_elements
         }
 
+    @_profile
     def _create_hole_small_beam_stirrups(self,
                                         x_left: float, x_right: float,
                                         z_top: float, z_bottom: float,
@@ -1243,139 +1455,111 @@ class RebarEngine:
         elems_top: List = []
         elems_bot: List = []
 
+        # 标量参数入口处统一转成 float，下文直接使用局部量
+        x_left, x_right, z_top, z_bottom, spacing, cover, H, edge_clear = map(
+            float, (x_left, x_right, z_top, z_bottom, spacing, cover, H, edge_clear))
         if spacing <= 0:
             return nodes, elems_top, elems_bot
 
         # 生成 X 位置（含两端）
-        x_positions = []
-        x0_raw = float(min(x_left, x_right))
-        x1_raw = float(max(x_left, x_right))
-        x0 = x0_raw + float(edge_clear)
-        x1 = x1_raw - float(edge_clear)
+        x0_raw = min(x_left, x_right)
+        x1_raw = max(x_left, x_right)
+        x0 = x0_raw + edge_clear
+        x1 = x1_raw - edge_clear
         if x1 <= x0 + 1e-6:
             # 洞口过窄或 edge_clear 过大：退化为洞口中心
             mid = 0.5 * (x0_raw + x1_raw)
             x0 = mid
             x1 = mid
-        n = max(1, int((x1 - x0) / spacing) + 1)
-        for i in range(n):
-            xv = x0 + i * spacing
-            if xv <= x1 + 1e-6:
-                x_positions.append(float(xv))
-        x_positions.extend([float(x0), float(x1)])
-        x_positions = sorted(set(round(v, 6) for v in x_positions))
+        x_positions = _x_grid_closed(x0, x1, spacing)
 
         # 洞顶/洞底“小梁箍筋”：
         # - 作为洞口上下两个“独立小梁”的箍筋笼，禁止任何钢筋线段穿过洞口真空区
         # - 顶部带：洞顶 + cover -> 梁顶 - cover
         # - 底部带：梁底 + cover -> 洞底 - cover（贯通到梁底，并包住下翼缘混凝土）
-        try:
-            legs_req = int(legs)
-        except Exception:
-            legs_req = 4
+        legs_req = int(legs) if legs is not None else 4
         legs_eff = max(2, legs_req)
 
-        y_web = float(self.geometry.Tw) / 2.0 - float(cover)
+        # 截面尺寸一次取出（后续布置只用局部量，不再访问 geometry）
+        gf = self._geom_cache
+        Tw = gf.Tw
+        bf_lower = max(gf.bf_ll, gf.bf_rl, 0.0)
+        tf_lower = max(gf.tf_ll, gf.tf_rl, 0.0)
+
+        y_web = Tw / 2.0 - cover
         # 底部带外包宽度：若存在下翼缘，外包到下翼缘外侧；否则外包到腹板
-        bf_ll = float(getattr(self.geometry, "bf_ll", 0.0) or 0.0)
-        bf_rl = float(getattr(self.geometry, "bf_rl", 0.0) or 0.0)
-        bf_lower = max(bf_ll, bf_rl, 0.0)
-        y_outer_bot = (float(self.geometry.Tw) + 2.0 * float(bf_lower)) / 2.0 - float(cover) if bf_lower > 1e-6 else float(y_web)
+        y_outer_bot = (Tw + 2.0 * bf_lower) / 2.0 - cover if bf_lower > 1e-6 else y_web
 
-        top_z2 = float(H) - float(cover)
-        top_z1_raw = float(z_top) + float(cover)
-        top_z1 = max(float(cover), min(top_z1_raw, top_z2))
+        top_z2 = H - cover
+        top_z1_raw = z_top + cover
+        top_z1 = _clip(top_z1_raw, cover, top_z2)
         top_enabled = (top_z2 > top_z1 + 1e-6)
 
-        bot_z1 = float(cover)
-        bot_z2_raw = float(z_bottom) - float(cover)
-        bot_z2 = max(bot_z1 + 1.0, min(float(H) - float(cover), bot_z2_raw))
+        bot_z1 = cover
+        bot_z2_raw = z_bottom - cover
+        bot_z2 = _clip(bot_z2_raw, bot_z1 + 1.0, H - cover)
         bot_enabled = (bot_z2 > bot_z1 + 1e-6)
 
-        def _y_positions_for_top() -> List[float]:
-            if legs_eff <= 2 or y_web <= 1e-6:
-                return [-y_web, y_web]
-            k = legs_eff - 2
-            step = (2.0 * y_web) / float(k + 1)
-            mids = [(-y_web + float(i) * step) for i in range(1, k + 1)]
-            return [float(-y_web)] + [float(round(v, 6)) for v in mids] + [float(y_web)]
-
-        def _y_positions_for_bottom() -> List[float]:
-            # 无下翼缘或要求<=2肢：外包到 y_outer_bot（此时 y_outer_bot==y_web 或退化）
-            if legs_eff <= 2 or y_outer_bot <= 1e-6:
-                return [-y_outer_bot, y_outer_bot]
-            k = legs_eff - 2
-            step = (2.0 * y_outer_bot) / float(k + 1)
-            mids = [(-y_outer_bot + float(i) * step) for i in range(1, k + 1)]
-            return [float(-y_outer_bot)] + [float(round(v, 6)) for v in mids] + [float(y_outer_bot)]
-
-        def _y_positions_inner_web(nlegs: int) -> List[float]:
-            nlegs = max(2, int(nlegs))
-            if nlegs <= 2 or y_web <= 1e-6:
-                return [-y_web, y_web]
-            k = nlegs - 2
-            step = (2.0 * y_web) / float(k + 1)
-            mids = [(-y_web + float(i) * step) for i in range(1, k + 1)]
-            return [float(-y_web)] + [float(round(v, 6)) for v in mids] + [float(y_web)]
-
-        def _multi_leg_ring_at(xv: float, z1: float, z2: float, y_positions: List[float]) -> Tuple[List, List]:
-            ys = [float(v) for v in (y_positions or [])]
-            ys = sorted(set(round(v, 6) for v in ys))
-            if len(ys) < 2:
-                ys = [-y_web, y_web]
-
-            nb = [Node(xv, float(yv), float(z1)) for yv in ys]
-            nt = [Node(xv, float(yv), float(z2)) for yv in ys]
-            _nodes = nb + nt
-            _elems: List = []
-
-            # 底部横向：分段连接，内部节点用于“内肢落点”
-            for i in range(len(nb) - 1):
-                _elems.append(Element([nb[i].id, nb[i + 1].id], etype=EleType.Link))
-            # 顶部横向：分段连接
-            for i in range(len(nt) - 1):
-                _elems.append(Element([nt[i].id, nt[i + 1].id], etype=EleType.Link))
-            # 竖向肢：每个 y 一个竖向单元
-            for i in range(len(nb)):
-                _elems.append(Element([nb[i].id, nt[i].id], etype=EleType.Link))
-
-            self._tag_elements_diameter(_elems, diameter)
-            return _nodes, _elems
-
-        for xv in x_positions:
-            # 顶部带（无空间则跳过）
-            if top_enabled:
-                ns, es = _multi_leg_ring_at(float(xv), float(top_z1), float(top_z2), _y_positions_for_top())
-                nodes.extend(ns); elems_top.extend(es)
-            # 底部带
-            if bot_enabled:
-                # 关键：下翼缘外肢（±y_outer_bot）仅应出现在下翼缘高度范围内；
-                # 若直接把外肢贯通到 bot_z2（通常 > tf_lower-cover），会在“上部腹板窄区”越出混凝土，触发 PKPM: rebar.within_concrete.y_by_z。
-                tf_ll = float(getattr(self.geometry, "tf_ll", 0.0) or 0.0)
-                tf_rl = float(getattr(self.geometry, "tf_rl", 0.0) or 0.0)
-                tf_lower = max(tf_ll, tf_rl, 0.0)
-                z_step = max(float(bot_z1) + 1.0, min(float(bot_z2), float(tf_lower) - float(cover))) if tf_lower > 1e-6 else float(bot_z1)
-
-                stepped = (y_outer_bot > y_web + 1e-6) and (legs_eff >= 4) and (z_step > float(bot_z1) + 1e-6) and (z_step < float(bot_z2) - 1e-6)
-                if stepped:
-                    # “总肢数(含外肢)”口径：外肢 2 根（仅在下翼缘范围），其余肢为腹板内肢（贯通到 bot_z2）
-                    inner_legs = max(2, int(legs_eff) - 2)
-                    ns1, es1 = _multi_leg_ring_at(float(xv), float(bot_z1), float(bot_z2), _y_positions_inner_web(inner_legs))
-                    ns2, es2 = _multi_leg_ring_at(float(xv), float(bot_z1), float(z_step), [-float(y_outer_bot), float(y_outer_bot)])
-                    nodes.extend(ns1 + ns2)
-                    elems_bot.extend(es1 + es2)
-                else:
-                    ns, es = _multi_leg_ring_at(float(xv), float(bot_z1), float(bot_z2), _y_positions_for_bottom())
-                    nodes.extend(ns); elems_bot.extend(es)
-
+        # 各带肢位置与 X 无关：循环外一次算好
+        # - 顶部带：腹板内 legs_eff 肢
+        # - 底部带：无下翼缘或要求<=2肢时外包到 y_outer_bot（此时 y_outer_bot==y_web 或退化）
+        # - 台阶式底部带：腹板内肢（总肢数扣除 2 根外肢）+ 仅在下翼缘范围内的 ±y_outer_bot 外肢
+        def _clean_ys(y_positions: List[float]) -> List[float]:
+            # 去重（6位小数）+ 升序；不足 2 肢时回退到腹板两侧
+            ys = sorted(set(round(float(v), 6) for v in (y_positions or [])))
+            return ys if len(ys) >= 2 else [-y_web, y_web]
+
+        top_ys = _clean_ys(_symmetric_leg_ys(y_web, legs_eff))
+        bot_ys_full = _clean_ys(_symmetric_leg_ys(y_outer_bot, legs_eff))
+        inner_ys = _clean_ys(_symmetric_leg_ys(y_web, max(2, legs_eff - 2)))
+        outer_ys = _clean_ys([-y_outer_bot, y_outer_bot])
+
+        # 关键：下翼缘外肢（±y_outer_bot）仅应出现在下翼缘高度范围内；
+        # 若直接把外肢贯通到 bot_z2（通常 > tf_lower-cover），会在“上部腹板窄区”越出混凝土，触发 PKPM: rebar.within_concrete.y_by_z。
+        z_step = _clip(tf_lower - cover, bot_z1 + 1.0, bot_z2) if tf_lower > 1e-6 else bot_z1
+        stepped = (y_outer_bot > y_web + 1e-6) and (legs_eff >= 4) and (z_step > bot_z1 + 1e-6) and (z_step < bot_z2 - 1e-6)
+
+        # 顶/底两带融合为同一个截面模板，整段只沿 X 展开一次：
+        # - 节点：逐环依次为底部各肢点、顶部各肢点（ys 须为 _clean_ys 处理后的升序、去重列表）
+        # - 单元：顶部带/底部带各一份连接表，表内逐环依次为 底部横向分段 -> 顶部横向分段 -> 竖向肢
+        points: List[Tuple[float, float]] = []
+        top_edges: List[Tuple[int, int]] = []
+        bot_edges: List[Tuple[int, int]] = []
+
+        def _add_ring(z1: float, z2: float, ys: List[float], edges: List[Tuple[int, int]]) -> None:
+            base = len(points)
+            points.extend((yv, z1) for yv in ys)
+            points.extend((yv, z2) for yv in ys)
+            edges.extend((base + a, base + b) for a, b in _ladder_ring_edges(len(ys)))
+
+        # 顶部带（无空间则跳过）
+        if top_enabled:
+            _add_ring(top_z1, top_z2, top_ys, top_edges)
+        # 底部带
+        if bot_enabled:
+            if stepped:
+                # “总肢数(含外肢)”口径：外肢 2 根（仅在下翼缘范围），其余肢为腹板内肢（贯通到 bot_z2）
+                _add_ring(bot_z1, bot_z2, inner_ys, bot_edges)
+                _add_ring(bot_z1, z_step, outer_ys, bot_edges)
+            else:
+                _add_ring(bot_z1, bot_z2, bot_ys_full, bot_edges)
+
+        # 整段沿 X 一次展开并创建节点；两带各按模板连接与各道偏移批量创建单元
+        (xs, ys_col, zs), offsets = _sweep_template(x_positions, points)
+        nodes, ids = _bulk_nodes(xs, ys_col, zs)
+        elems_top.extend(_bulk_links(ids, top_edges, offsets))
+        elems_bot.extend(_bulk_links(ids, bot_edges, offsets))
+
+        # 全部小梁箍筋同一直径：生成完毕后统一标注，而不是每道环各调一次
+        self._tag_elements_diameter(elems_top, diameter)
+        self._tag_elements_diameter(elems_bot, diameter)
         return nodes, elems_top, elems_bot
 
-    def _create_hole_longitudinal_rebars(self, x_start: float, x_end: float,
-                                          z: float, y_width: float, count: int,
-                                          diameter: float, cover: float,
-                                          holes: List[HoleParams] = None) -> Dict:
+    def _hole_long_bundle(self, x_start: float, x_end: float,
+                          z: float, y_width: float, count: int,
+                          diameter: float, cover: float) -> Tuple:
         """
-        创建洞口顶/底的水平补强纵筋
+        洞口顶/底水平补强纵筋的一组钢筋参数，供 _create_rebar_lines_batch 批量生成
 
         Args:
             x_start, x_end: X方向范围 (含锚固长度)
@@ -1386,22 +1570,9 @@ class RebarEngine:
             cover: 保护层
 
         Returns:
-            {'nodes': [], 'elements': []}
+            (x_start, x_end, z, y_positions, diameter)
         """
-        # 计算Y方向位置
-        y_positions = self._calculate_rebar_y_positions(y_width, count, cover)
-
-        # 复用通用纵筋生成（含洞口真空区避让）
-        nodes, elements = self._create_rebar_line(
-            x_start=float(x_start),
-            x_end=float(x_end),
-            z=float(z),
-            y_positions=[float(v) for v in (y_positions or [])],
-            diameter=float(diameter),
-            num_segments=10,
-            holes=holes
-        )
-        return {'nodes': nodes, 'elements': elements}
+        return (x_start, x_end, z, self._calculate_rebar_y_positions(y_width, count, cover), diameter)
 
     def _create_hole_side_i_stirrups(self, x_start: float, x_end: float,
                                      spacing: float,
@@ -1409,37 +1580,32 @@ class RebarEngine:
                                      z_bottom: float,
                                      z_flange_top_left: float, z_flange_top_right: float,
                                      z_top: float,
-                                     legs: int, diameter: float) -> Dict:
+                                     legs: int, diameter: float) -> Tuple[List, List]:
         """
         洞口两侧加强箍筋：使用与全局一致的工字型 ring13（同高同形）
-        """
-        nodes = []
-        elements = []
 
+        Returns:
+            ([Node列表], [Element列表])
+        """
         if spacing <= 0:
-            return {'nodes': nodes, 'elements': elements}
+            return [], []
 
         x_min = min(x_start, x_end)
         x_max = max(x_start, x_end)
         n = max(1, int((x_max - x_min) / spacing) + 1)
-        x_positions = [x_min + i * spacing for i in range(n) if (x_min + i * spacing) <= x_max + 1e-6]
-
-        for x in x_positions:
-            ring_nodes, ring_elements = self._create_single_i_shaped_stirrup(
-                x=x,
-                y_outer=y_outer,
-                y_inner=y_inner,
-                z_bottom=z_bottom,
-                z_flange_top_left=z_flange_top_left,
-                z_flange_top_right=z_flange_top_right,
-                z_top=z_top,
-                legs=legs,
-                diameter=diameter
-            )
-            nodes.extend(ring_nodes)
-            elements.extend(ring_elements)
+        x_positions = _x_grid(x_min, spacing, n, x_max + 1e-6)
 
-        return {'nodes': nodes, 'elements': elements}
+        return self._create_i_stirrups_batch(
+            x_positions,
+            y_outer=y_outer,
+            y_inner=y_inner,
+            z_bottom=z_bottom,
+            z_flange_top_left=z_flange_top_left,
+            z_flange_top_right=z_flange_top_right,
+            z_top=z_top,
+            legs=legs,
+            diameter=diameter
+        )
 
     def _create_hole_side_stirrups(self, x_start: float, x_end: float,
                                     spacing: float, y_width: float,
@@ -1460,55 +1626,47 @@ class RebarEngine:
         Returns:
             {'nodes': [], 'elements': []}
         """
-        nodes = []
-        elements = []
-
         # 计算箍筋X位置
         num_stirrups = max(1, int((x_end - x_start) / spacing) + 1)
-        x_positions = [x_start + i * spacing for i in range(num_stirrups) if x_start + i * spacing <= x_end]
+        x_positions = _x_grid(x_start, spacing, num_stirrups, x_end)
 
         # Y范围
         y_min = -y_width / 2 + cover
         y_max = y_width / 2 - cover
 
-        for x in x_positions:
-            # 创建矩形箍筋 (4个角点)
-            n1 = Node(x, y_min, z_bottom + cover)  # 左下
-            n2 = Node(x, y_max, z_bottom + cover)  # 右下
-            n3 = Node(x, y_max, z_top - cover)     # 右上
-            n4 = Node(x, y_min, z_top - cover)     # 左上
-            nodes.extend([n1, n2, n3, n4])
-
-            # 4条边
-            e1 = Element([n1.id, n2.id], etype=EleType.Link)  # 底边
-            e2 = Element([n2.id, n3.id], etype=EleType.Link)  # 右边
-            e3 = Element([n3.id, n4.id], etype=EleType.Link)  # 顶边
-            e4 = Element([n4.id, n1.id], etype=EleType.Link)  # 左边
-            elements.extend([e1, e2, e3, e4])
-            self._tag_elements_diameter([e1, e2, e3, e4], diameter)
-
-            # 多肢箍筋：添加中间拉筋
-            if legs >= 4:
-                inner_count = legs - 2
-                y_spacing = (y_max - y_min) / (inner_count + 1)
-                for j in range(1, inner_count + 1):
-                    y_mid = y_min + j * y_spacing
-                    n_bot = Node(x, y_mid, z_bottom + cover)
-                    n_top = Node(x, y_mid, z_top - cover)
-                    nodes.extend([n_bot, n_top])
-                    e_mid = Element([n_bot.id, n_top.id], etype=EleType.Link)
-                    try:
-                        e_mid.diameter = float(diameter)
-                    except Exception:
-                        pass
-                    elements.append(e_mid)
+        # 矩形箍筋 4 个角点的截面坐标（与X无关，循环外一次算好）
+        z_lo = z_bottom + cover
+        z_hi = z_top - cover
+        corners = (
+            (y_min, z_lo),  # 左下
+            (y_max, z_lo),  # 右下
+            (y_max, z_hi),  # 右上
+            (y_min, z_hi),  # 左上
+        )
+        # 多肢箍筋中间拉筋的 Y 坐标：在 [y_min, y_max] 内等分，同样只算一次
+        y_mids = _leg_positions(y_max, legs - 2) if legs >= 4 else []
+
+        # 截面模板：4 角点 + 每根拉筋的底/顶两点；单元为 4 条边（底边 -> 右边 -> 顶边 -> 左边）+ 拉筋
+        points = list(corners)
+        edges = list(_RECT_RING_EDGES)
+        for y_mid in y_mids:
+            base = len(points)
+            points.append((y_mid, z_lo))
+            points.append((y_mid, z_hi))
+            edges.append((base, base + 1))
+
+        # 整段一次展开坐标与连接，再统一创建 Node/Element
+        (xs, ys, zs), offsets = _sweep_template(x_positions, points)
+        nodes, ids = _bulk_nodes(xs, ys, zs)
+        elements = _bulk_links(ids, edges, offsets)
+        self._tag_elements_diameter(elements, diameter)
 
         return {'nodes': nodes, 'elements': elements}
 
 
 if __name__ == "__main__":
     # 测试代码
-    from core.parameters import GeometryParams, LongitudinalRebar, RebarSpec, StirrupParams
+    from core.parameters import RebarSpec
 
     print("=" * 60)
     print("钢筋引擎测试")
@@ -1,6 +1,6 @@
+import importlib.util
 import os
 import sys
-import traceback
 from pathlib import Path
 
 
@@ -37,16 +37,15 @@ def main() -> int:
     temp_dir = Path(os.environ.get("TEMP") or os.environ.get("TMP") or str(app_dir))
     log_path = temp_dir / "pkpm_composite_beam_ui.log"
 
-    try:
-        import PyQt5  # noqa: F401
-    except Exception as e:
+    # 仅探测 PyQt5 是否可导入，不执行其包初始化（真正导入由 ui_main_pro 完成）
+    if importlib.util.find_spec("PyQt5") is None:
         msg = (
             "无法启动 UI：缺少 PyQt5 依赖。\n\n"
             "请先运行：安装依赖.bat\n\n"
             f"Python: {sys.executable}\n"
             f"日志: {log_path}\n"
         )
-        _write_log(log_path, msg + "\n\n" + "".join(traceback.format_exception(type(e), e, e.__traceback__)))
+        _write_log(log_path, f"{msg}\n\nPyQt5 module not found (Python: {sys.executable})\n")
         _message_box("PKPM-CAE Composite Beam Tool", msg)
         return 1
 
@@ -61,6 +60,8 @@ def main() -> int:
         code = int(getattr(e, "code", 0) or 0)
         return code
     except Exception as e:
+        import traceback
+
         msg = (
             "UI 运行异常，已生成日志。\n\n"
             f"Python: {sys.executable}\n"
@@ -68,7 +69,8 @@ def main() -> int:
             f"日志: {log_path}\n\n"
             "请把日志内容发回以便定位修复。"
         )
-        _write_log(log_path, msg + "\n\n" + "".join(traceback.format_exception(type(e), e, e.__traceback__)))
+        tb = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+        _write_log(log_path, f"{msg}\n\n{tb}")
         _message_box("PKPM-CAE Composite Beam Tool", msg)
         return 1
 
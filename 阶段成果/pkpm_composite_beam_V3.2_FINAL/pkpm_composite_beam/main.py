@@ -1,4 +1,6 @@
+import itertools
 import sys, os
+from operator import attrgetter
 from pathlib import Path
 
 # --- 路径修正逻辑 ---
@@ -13,6 +15,7 @@ from parsers.excel_parser import ExcelParser
 from core.rebar_engine import RebarEngine
 from core.fillet_processor import FilletProcessor, FilletConfig
 
+
 class CompositeBeamModelGenerator:
     def __init__(self, excel_path: str):
         self.excel_path = excel_path
@@ -506,20 +509,20 @@ class CompositeBeamModelGenerator:
             except Exception:
                 pass
 
-        # 构建钢筋节点查找表
-        node_lookup = {}
+        # 构建钢筋节点查找表：纵筋 + 箍筋 + 【新增】洞口加强筋节点，一次遍历直接建表（不逐段建临时字典再合并）
+        node_sources = []
         if self.long_rebar_result:
-            node_lookup.update({n.id: n for n in self.long_rebar_result['all_nodes']})
+            node_sources.append(self.long_rebar_result['all_nodes'])
         if self.stirrup_result:
-            node_lookup.update({n.id: n for n in self.stirrup_result['all_nodes']})
-        # 【新增】洞口加强筋节点
+            node_sources.append(self.stirrup_result['all_nodes'])
         for hole_reinf in self.hole_reinf_results:
-            node_lookup.update({n.id: n for n in hole_reinf.get('all_nodes', [])})
+            node_sources.append(hole_reinf.get('all_nodes', []))
+        node_lookup = {n.id: n for n in itertools.chain.from_iterable(node_sources)}
 
         # 【调试】打印箍筋Y坐标范围，验证工字型是否生效
         if self.stirrup_result and len(self.stirrup_result.get('all_nodes', [])) > 0:
-            stirrup_y_coords = [n.y for n in self.stirrup_result['all_nodes']]
-            stirrup_z_coords = [n.z for n in self.stirrup_result['all_nodes']]
+            # 按分量一次取出 Y/Z 坐标列（C 层 attrgetter），不再对节点列表分两遍逐个取属性
+            stirrup_y_coords, stirrup_z_coords = zip(*map(attrgetter("y", "z"), self.stirrup_result['all_nodes']))
             print(f">>> 【验证】箍筋Y坐标范围: {min(stirrup_y_coords):.1f} ~ {max(stirrup_y_coords):.1f} mm")
             print(f">>> 【验证】箍筋Z坐标范围: {min(stirrup_z_coords):.1f} ~ {max(stirrup_z_coords):.1f} mm")
             print(f">>> 【验证】箍筋节点总数: {len(self.stirrup_result['all_nodes'])}")
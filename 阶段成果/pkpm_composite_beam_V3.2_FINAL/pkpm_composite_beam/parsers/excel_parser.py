@@ -3,20 +3,100 @@ PKPM-CAE 叠合梁参数化建模 - Excel 参数解析模块
 从 Excel 模板 V3.0 中读取参数并转换为参数对象
 """
 
+import copy
 import importlib
-from typing import Dict, Any, List, Optional
-import sys
+import importlib.util
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 import os
 
-# 添加父目录到路径以便导入 core 模块
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+# core / parsers 为工程根目录下的同级包：由入口脚本（main.py / ui_main_pro.py）把工程根目录加入 sys.path
 from core.parameters import (
     BeamParameters, GeometryParams, LongitudinalRebar, RebarSpec,
     StirrupParams, HoleParams, LoadCase, BoundaryCondition, PrestressParams
 )
 
 
+# 进程内解析结果缓存：绝对路径 -> ((mtime_ns, size), BeamParameters)
+# - 同一文件未修改时（UI 反复同步/生成）跳过 XLSX 解析；存取均 deepcopy，调用方可随意修改返回对象
+# - 每个路径只保留最新一份（文件改动后旧结果被替换），路径数按 LRU 上限淘汰，长时间运行的 UI 不会累积
+_PARSE_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], BeamParameters]]" = OrderedDict()
+_PARSE_CACHE_MAX = 8
+
+
+@lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """可选依赖探测（进程内只做一次）：可导入则返回模块，否则 None"""
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _has_module(name: str) -> bool:
+    """仅检查可选依赖是否已安装（不执行其导入）；进程内只查一次"""
+    return importlib.util.find_spec(name) is not None
+
+
+def _index_rows(rows: List[Dict[str, Any]], key: str) -> Dict[str, Dict[str, Any]]:
+    """按 key 列（去首尾空白）建立 名称 -> 行 索引；同名取第一行（与逐行查找一致）"""
+    index: Dict[str, Dict[str, Any]] = {}
+    for r in rows:
+        index.setdefault(str(r.get(key, '')).strip(), r)
+    return index
+
+
+def _strip_name(name: Any) -> Any:
+    return name.strip() if isinstance(name, str) else name
+
+
+def _int_or_zero(v: Any) -> int:
+    return int(v or 0)
+
+
+# 行内名称别名表（frozenset：逐行 in 判断为 O(1) 哈希查找）
+_TOP_THROUGH_ALIASES = frozenset({"Top Through", "顶部通长", "TopThrough"})
+_SUPPORT_TOP_KEYS = frozenset({"Left Support Top", "Right Support Top"})
+_TOP_GROUP_ALIASES = frozenset({'top', '顶部', 'upper'})
+_BOTTOM_GROUP_ALIASES = frozenset({'bottom', '底部', 'lower'})
+_TRUE_ALIASES = frozenset({'true', 'yes', '1', 'enabled'})
+_PRETENSION_ALIASES = frozenset({'pre_tension', 'pretension', '先张', '先张法'})
+
+# Geometry sheet 截面尺寸列（列名即 GeometryParams 字段名）
+_GEOMETRY_COLUMNS = (
+    'L', 'H', 'Tw',
+    'bf_lu', 'tf_lu', 'bf_ru', 'tf_ru',
+    'bf_ll', 'tf_ll', 'bf_rl', 'tf_rl',
+    'h_pre',
+)
+
+# Holes sheet 可选列：(HoleParams 字段, 列名, 转换函数, 缺省值)，逐行按表一次转换
+_HOLE_OPTIONAL_COLUMNS = (
+    ('fillet_radius', 'Fillet_Radius', float, 0.0),
+
+    # 小梁配筋
+    ('small_beam_long_diameter', 'SmallBeam_Long_Diameter', float, 0.0),
+    ('small_beam_long_count', 'SmallBeam_Long_Count', int, 0),
+    ('small_beam_long_top_diameter', 'SmallBeam_Long_Top_Diameter', float, 0.0),
+    ('small_beam_long_top_count', 'SmallBeam_Long_Top_Count', int, 0),
+    ('small_beam_long_bottom_diameter', 'SmallBeam_Long_Bottom_Diameter', float, 0.0),
+    ('small_beam_long_bottom_count', 'SmallBeam_Long_Bottom_Count', int, 0),
+    ('small_beam_stirrup_diameter', 'SmallBeam_Stirrup_Diameter', float, 0.0),
+    ('small_beam_stirrup_spacing', 'SmallBeam_Stirrup_Spacing', float, 0.0),
+    ('small_beam_stirrup_legs', 'SmallBeam_Stirrup_Legs', _int_or_zero, 0),
+
+    # 洞侧补强
+    ('left_reinf_length', 'Left_Reinf_Length', float, 0.0),
+    ('right_reinf_length', 'Right_Reinf_Length', float, 0.0),
+    ('side_stirrup_spacing', 'Side_Stirrup_Spacing', float, 0.0),
+    ('side_stirrup_diameter', 'Side_Stirrup_Diameter', float, 0.0),
+    ('side_stirrup_legs', 'Side_Stirrup_Legs', int, 2),
+    ('reinf_extend_length', 'Reinf_Extend_Length', float, 0.0),
+)
+
+
 class ExcelParser:
     """Excel 参数解析器
 
@@ -38,6 +118,8 @@ class ExcelParser:
         """
         self.excel_path = excel_path
         self.excel_file = None
+        # sheet 名 -> 行列表；首次读取时整本工作簿一次读入
+        self._sheets: Optional[Dict[str, List[Dict[str, Any]]]] = None
 
     def parse(self) -> BeamParameters:
         """
@@ -49,32 +131,67 @@ class ExcelParser:
         Raises:
             ValueError: 参数解析失败
             FileNotFoundError: Excel 文件不存在
+
+        Note:
+            同一文件（路径、mtime、大小均未变）命中进程内缓存时直接返回结果副本，不读取工作簿；
+            此时 self._sheets / self.excel_file 等读取器属性保持未填充状态。
         """
-        # 读取策略：
-        # - 优先 pandas + openpyxl（若环境已安装依赖）
-        # - 若 openpyxl 缺失或读取失败，则回退到 stdlib-only 的最小 XLSX 读取器（仅支持本项目表格型sheet）
+        try:
+            st = os.stat(self.excel_path)
+            path = os.path.abspath(self.excel_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            path = None  # 文件不存在等：交给实际解析抛出原有异常
+        if path is not None:
+            entry = _PARSE_CACHE.get(path)
+            if entry is not None and entry[0] == stamp:
+                _PARSE_CACHE.move_to_end(path)
+                return copy.deepcopy(entry[1])
+
+        params = self._parse_workbook()
+        if path is not None:
+            _PARSE_CACHE[path] = (stamp, copy.deepcopy(params))
+            _PARSE_CACHE.move_to_end(path)
+            while len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+                _PARSE_CACHE.popitem(last=False)
+        return params
+
+    def _parse_workbook(self) -> BeamParameters:
+        """读取工作簿并解析全部 Sheet（不经缓存）"""
+        # 读取策略（尽量减少依赖与打包复杂度）：
+        # 1) stdlib-only 最小 XLSX 读取器：本项目模板均为“表头 + 数据行”的小表，直接读成行字典，
+        #    无需导入 pandas、也不构建 DataFrame
+        # 2) 最小读取器无法处理（非 xlsx / 结构异常）时，依次尝试：
+        #    pandas + calamine -> openpyxl 只读流式 -> pandas 默认引擎
         self._pd = None
         self._use_minimal = True
         self.excel_file = None
+        self._sheets = None
 
-        # 读取策略（尽量减少依赖与打包复杂度）：
-        # - 默认使用 stdlib-only 最小 XLSX 读取器（支持本项目模板的“表格型sheet”）
-        # - 若环境已安装 pandas 且 ExcelFile 可用，则自动切换为 pandas 读取（更宽容）
+        from parsers.xlsx_minimal import read_all_table_rows
         try:
-            self._pd = importlib.import_module("pandas")
+            self._sheets = read_all_table_rows(self.excel_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Excel 文件不存在: {self.excel_path}")
         except Exception:
-            self._pd = None
+            self._sheets = None
 
-        if self._pd is not None:
-            try:
+        if self._sheets is None:
+            self._pd = _optional_module("pandas")
+
+            if self._pd is not None and _has_module("python_calamine"):
+                self._try_pandas_engine("calamine")
+
+            if self._use_minimal and _has_module("openpyxl"):
+                try:
+                    self._sheets = self._read_openpyxl_sheets()
+                    self._use_minimal = False
+                except Exception:
+                    self._sheets = None
+
+            if self._use_minimal and self._pd is not None:
                 # 不显式指定 openpyxl，避免在无 openpyxl 环境下直接 ImportError
-                self.excel_file = self._pd.ExcelFile(self.excel_path)
-                self._use_minimal = False
-            except FileNotFoundError:
-                raise FileNotFoundError(f"Excel 文件不存在: {self.excel_path}")
-            except Exception:
-                self.excel_file = None
-                self._use_minimal = True
+                self._try_pandas_engine(None)
 
         # 解析各个 Sheet
         geometry = self._parse_geometry()
@@ -98,24 +215,78 @@ class ExcelParser:
 
         return params
 
-    def _is_na(self, v: Any) -> bool:
-        if v is None:
-            return True
+    def _try_pandas_engine(self, engine: Optional[str]) -> None:
+        """尝试以指定引擎打开 pandas.ExcelFile；成功则切换到 pandas 读取"""
         try:
-            pd = getattr(self, "_pd", None)
-            if pd is not None and pd.isna(v):
-                return True
+            self.excel_file = self._pd.ExcelFile(self.excel_path, engine=engine)
+            self._use_minimal = False
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Excel 文件不存在: {self.excel_path}")
         except Exception:
-            pass
+            self.excel_file = None
+            self._use_minimal = True
+
+    def _read_openpyxl_sheets(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        openpyxl 只读模式读取全部 sheet（表格型：首行表头 + 数据行）
+
+        行格式与最小读取器一致：空单元格为 None，整行为空的行跳过，空表头列忽略。
+        """
+        openpyxl = importlib.import_module("openpyxl")
+        wb = openpyxl.load_workbook(self.excel_path, read_only=True, data_only=True)
+        try:
+            sheets: Dict[str, List[Dict[str, Any]]] = {}
+            for ws in wb.worksheets:
+                it = ws.iter_rows(values_only=True)
+                header = next(it, None) or ()
+                headers = [("" if h is None else str(h).strip()) for h in header]
+                rows: List[Dict[str, Any]] = []
+                for vals in it:
+                    if all(v is None or (isinstance(v, str) and v.strip() == "") for v in vals):
+                        continue
+                    n = len(vals)
+                    rows.append({h: (vals[i] if i < n else None) for i, h in enumerate(headers) if h})
+                sheets[ws.title] = rows
+            return sheets
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _is_na(v: Any) -> bool:
+        # 空单元格：最小读取器/openpyxl 为 None，pandas 为 NaN（numpy 浮点也是 float 子类）
+        if v is None:
+            return True
+        if isinstance(v, float):
+            return v != v
         return False
 
-    def _read_rows(self, sheet_name: str) -> List[Dict[str, Any]]:
+    def _load_sheets(self) -> Dict[str, List[Dict[str, Any]]]:
+        """一次读取全部 sheet（工作簿只打开/解析一次），返回 sheet 名 -> 行列表"""
         if getattr(self, "_use_minimal", False):
-            from parsers.xlsx_minimal import read_table_rows
-            return read_table_rows(self.excel_path, sheet_name)
+            from parsers.xlsx_minimal import read_all_table_rows
+            return read_all_table_rows(self.excel_path)
         pd = self._pd
-        df = pd.read_excel(self.excel_file, sheet_name=sheet_name, header=0)
-        return [row.to_dict() for _, row in df.iterrows()]
+        # dtype=object：不做列类型推断，单元格原值直接交给 _parse_* 自行 float()/int()
+        frames = pd.read_excel(self.excel_file, sheet_name=None, header=0, dtype=object)
+        # 列名统一去首尾空白（与最小读取器/openpyxl 路径一致），后续按列名查找不再受模板空格影响
+        return {name: df.rename(columns=_strip_name).to_dict(orient="records") for name, df in frames.items()}
+
+    def _read_rows(self, sheet_name: str) -> List[Dict[str, Any]]:
+        if self._sheets is None:
+            self._sheets = self._load_sheets()
+        rows = self._sheets.get(sheet_name)
+        if rows is None:
+            if getattr(self, "_use_minimal", False):
+                return []
+            # 与 pandas 按名读取不存在的 sheet 时一致：抛 ValueError
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        return rows
+
+    def _optional_rows(self, sheet_name: str) -> List[Dict[str, Any]]:
+        """可选 sheet（Longitudinal Layout / Boundary / Prestress）：不存在时返回空列表"""
+        if self._sheets is None:
+            self._sheets = self._load_sheets()
+        return self._sheets.get(sheet_name) or []
 
     def _parse_geometry(self) -> GeometryParams:
         """解析 Sheet 1: Geometry"""
@@ -125,18 +296,7 @@ class ExcelParser:
         data = rows[0]
 
         return GeometryParams(
-            L=float(data.get('L', 0)),
-            H=float(data.get('H', 0)),
-            Tw=float(data.get('Tw', 0)),
-            bf_lu=float(data.get('bf_lu', 0)),
-            tf_lu=float(data.get('tf_lu', 0)),
-            bf_ru=float(data.get('bf_ru', 0)),
-            tf_ru=float(data.get('tf_ru', 0)),
-            bf_ll=float(data.get('bf_ll', 0)),
-            tf_ll=float(data.get('tf_ll', 0)),
-            bf_rl=float(data.get('bf_rl', 0)),
-            tf_rl=float(data.get('tf_rl', 0)),
-            h_pre=float(data.get('h_pre', 0)),
+            **{k: float(data.get(k, 0)) for k in _GEOMETRY_COLUMNS},
             # 现浇顶盖厚度（进入上翼缘内部的叠合面切分）：老模板可缺省，默认0=自动/不强制
             t_cast_cap=float(data.get('t_cast_cap', data.get('t_cast', 0)) or 0)
         )
@@ -180,9 +340,9 @@ class ExcelParser:
             rebar_b = _spec(dia_b, count_b, extend)
 
             # 兼容：将“Top Through”映射为顶部通长筋（内部仍使用 mid_span_top 字段）
-            key = "Mid Span Top" if position in ["Top Through", "顶部通长", "TopThrough"] else position
+            key = "Mid Span Top" if position in _TOP_THROUGH_ALIASES else position
             rebars[key] = (rebar_a, rebar_b)
-            if key in ["Left Support Top", "Right Support Top"]:
+            if key in _SUPPORT_TOP_KEYS:
                 try:
                     support_len[key] = float(extend or 0.0)
                 except Exception:
@@ -224,11 +384,8 @@ class ExcelParser:
         # | Group | Rows | RowSpacing |
         # | Top   | 2    | 40         |
         # | Bottom| 2    | 40         |
-        try:
-            layout_rows = self._read_rows('Longitudinal Layout')
-        except Exception:
-            layout_rows = []
-        for r in layout_rows or []:
+        layout_rows = self._optional_rows('Longitudinal Layout')
+        for r in layout_rows:
             group = str(r.get('Group', '') or '').strip().lower()
             if not group:
                 continue
@@ -241,10 +398,10 @@ class ExcelParser:
             except Exception:
                 sp = 0.0
 
-            if group in ['top', '顶部', 'upper']:
+            if group in _TOP_GROUP_ALIASES:
                 lr.top_rows = max(1, rows_n)
                 lr.top_row_spacing = max(0.0, sp)
-            elif group in ['bottom', '底部', 'lower']:
+            elif group in _BOTTOM_GROUP_ALIASES:
                 lr.bottom_rows = max(1, rows_n)
                 lr.bottom_row_spacing = max(0.0, sp)
 
@@ -261,8 +418,9 @@ class ExcelParser:
         # | Dense | ... | ... | ... |
         # | Normal | ... | ... | ... |
 
-        dense_row = next((r for r in rows if str(r.get('Zone', '')).strip() == 'Dense'), None)
-        normal_row = next((r for r in rows if str(r.get('Zone', '')).strip() == 'Normal'), None)
+        by_zone = _index_rows(rows, 'Zone')
+        dense_row = by_zone.get('Dense')
+        normal_row = by_zone.get('Normal')
         if dense_row is None or normal_row is None:
             raise ValueError("Stirrups sheet 缺少 Dense/Normal 行")
 
@@ -295,26 +453,7 @@ class ExcelParser:
                 z=float(row['Z']),
                 width=float(row['Width']),
                 height=float(row['Height']),
-                fillet_radius=float(row.get('Fillet_Radius', 0.0)),
-
-                # 小梁配筋
-                small_beam_long_diameter=float(row.get('SmallBeam_Long_Diameter', 0.0)),
-                small_beam_long_count=int(row.get('SmallBeam_Long_Count', 0)),
-                small_beam_long_top_diameter=float(row.get('SmallBeam_Long_Top_Diameter', 0.0)),
-                small_beam_long_top_count=int(row.get('SmallBeam_Long_Top_Count', 0)),
-                small_beam_long_bottom_diameter=float(row.get('SmallBeam_Long_Bottom_Diameter', 0.0)),
-                small_beam_long_bottom_count=int(row.get('SmallBeam_Long_Bottom_Count', 0)),
-                small_beam_stirrup_diameter=float(row.get('SmallBeam_Stirrup_Diameter', 0.0)),
-                small_beam_stirrup_spacing=float(row.get('SmallBeam_Stirrup_Spacing', 0.0)),
-                small_beam_stirrup_legs=int(row.get('SmallBeam_Stirrup_Legs', 0) or 0),
-
-                # 洞侧补强
-                left_reinf_length=float(row.get('Left_Reinf_Length', 0.0)),
-                right_reinf_length=float(row.get('Right_Reinf_Length', 0.0)),
-                side_stirrup_spacing=float(row.get('Side_Stirrup_Spacing', 0.0)),
-                side_stirrup_diameter=float(row.get('Side_Stirrup_Diameter', 0.0)),
-                side_stirrup_legs=int(row.get('Side_Stirrup_Legs', 2)),
-                reinf_extend_length=float(row.get('Reinf_Extend_Length', 0.0))
+                **{field: conv(row.get(col, default)) for field, col, conv, default in _HOLE_OPTIONAL_COLUMNS}
             )
             holes.append(hole)
 
@@ -352,10 +491,7 @@ class ExcelParser:
 
     def _parse_boundary(self) -> BoundaryCondition:
         """解析 Sheet 5: Boundary"""
-        try:
-            rows = self._read_rows('Boundary')
-        except Exception:
-            return BoundaryCondition()
+        rows = self._optional_rows('Boundary')
         if not rows:
             return BoundaryCondition()
 
@@ -364,8 +500,9 @@ class ExcelParser:
         # | Left | ... | ... | ... |
         # | Right | ... | ... | ... |
 
-        left_row = next((r for r in rows if str(r.get('End', '')).strip() == 'Left'), None)
-        right_row = next((r for r in rows if str(r.get('End', '')).strip() == 'Right'), None)
+        by_end = _index_rows(rows, 'End')
+        left_row = by_end.get('Left')
+        right_row = by_end.get('Right')
         if left_row is None or right_row is None:
             return BoundaryCondition()
 
@@ -398,25 +535,22 @@ class ExcelParser:
 
     def _parse_prestress(self) -> Optional[PrestressParams]:
         """解析 Sheet 6: Prestress"""
-        try:
-            rows = self._read_rows('Prestress')
-        except Exception:
-            return None
+        rows = self._optional_rows('Prestress')
         if not rows:
             return None
 
+        by_param = _index_rows(rows, 'Parameter')
+
         def _get_value(param_name: str, default=None):
-            for r in rows:
-                if str(r.get('Parameter', '')).strip() == param_name:
-                    return r.get('Value', default)
-            return default
+            r = by_param.get(param_name)
+            return default if r is None else r.get('Value', default)
 
         enabled_raw = _get_value('Enabled', 'False')
-        enabled = str(enabled_raw).lower() in ['true', 'yes', '1', 'enabled']
+        enabled = str(enabled_raw).lower() in _TRUE_ALIASES
 
         # 预应力方式：post_tension / pretension（可选，缺省=post_tension）
         method = str(_get_value('Method', 'post_tension') or 'post_tension').strip().lower()
-        if method in ['pre_tension', 'pretension', '先张', '先张法']:
+        if method in _PRETENSION_ALIASES:
             method = 'pretension'
         if method not in ['post_tension', 'pretension']:
             method = 'post_tension'
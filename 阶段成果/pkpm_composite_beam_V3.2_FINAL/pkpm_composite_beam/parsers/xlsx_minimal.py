@@ -47,15 +47,20 @@ def _cell_ref_to_rc(cell_ref: str) -> Tuple[int, int]:
 
 def _parse_shared_strings(z: zipfile.ZipFile) -> List[str]:
     try:
-        data = z.read("xl/sharedStrings.xml")
+        f = z.open("xl/sharedStrings.xml")
     except KeyError:
         return []
-    root = ET.fromstring(data)
+    si_tag = f"{{{_NS['main']}}}si"
+    t_tag = f"{{{_NS['main']}}}t"
     strings: List[str] = []
-    for si in root.findall(".//main:si", _NS):
-        # Shared string may be rich text (multiple <t> nodes).
-        ts = [t.text or "" for t in si.findall(".//main:t", _NS)]
-        strings.append("".join(ts))
+    # Stream the part: each <si> is consumed and cleared as soon as it ends,
+    # so memory stays O(one string item) instead of O(whole XML tree).
+    with f:
+        for _ev, el in ET.iterparse(f, events=("end",)):
+            if el.tag == si_tag:
+                # Shared string may be rich text (multiple <t> nodes).
+                strings.append("".join(t.text or "" for t in el.iter(t_tag)))
+                el.clear()
     return strings
 
 
@@ -116,6 +121,52 @@ def _cell_value(cell: ET.Element, shared: List[str]) -> Any:
         return s
 
 
+def _sheet_table_rows(z: zipfile.ZipFile, sheet_xml: str, shared: List[str]) -> List[Dict[str, Any]]:
+    root = ET.fromstring(z.read(sheet_xml))
+
+    # Build sparse map (row,col)->value
+    values: Dict[Tuple[int, int], Any] = {}
+    for c in root.findall(".//main:sheetData/main:row/main:c", _NS):
+        ref = c.attrib.get("r")
+        if not ref:
+            continue
+        try:
+            r, col = _cell_ref_to_rc(ref)
+        except Exception:
+            continue
+        values[(r, col)] = _cell_value(c, shared)
+
+    # Determine header row (1)
+    headers: List[str] = []
+    max_col = 0
+    for (r, col), v in values.items():
+        if r == 1:
+            max_col = max(max_col, col)
+    for col in range(1, max_col + 1):
+        hv = values.get((1, col))
+        if hv is None or str(hv).strip() == "":
+            headers.append("")
+        else:
+            headers.append(str(hv).strip())
+
+    # Data rows: until last row with any value
+    max_row = 0
+    for (r, _c) in values.keys():
+        max_row = max(max_row, r)
+    rows: List[Dict[str, Any]] = []
+    for r in range(2, max_row + 1):
+        row_vals: List[Any] = [values.get((r, c)) for c in range(1, max_col + 1)]
+        if all(v is None or (isinstance(v, str) and v.strip() == "") for v in row_vals):
+            continue
+        d: Dict[str, Any] = {}
+        for i, h in enumerate(headers):
+            if not h:
+                continue
+            d[h] = row_vals[i] if i < len(row_vals) else None
+        rows.append(d)
+    return rows
+
+
 def read_table_rows(xlsx_path: str, sheet_name: str) -> List[Dict[str, Any]]:
     """
     Reads a simple table sheet:
@@ -127,47 +178,17 @@ def read_table_rows(xlsx_path: str, sheet_name: str) -> List[Dict[str, Any]]:
         sheet_xml = sheet_map.get(sheet_name)
         if not sheet_xml:
             return []
-        shared = _parse_shared_strings(z)
-        root = ET.fromstring(z.read(sheet_xml))
+        return _sheet_table_rows(z, sheet_xml, _parse_shared_strings(z))
 
-        # Build sparse map (row,col)->value
-        values: Dict[Tuple[int, int], Any] = {}
-        for c in root.findall(".//main:sheetData/main:row/main:c", _NS):
-            ref = c.attrib.get("r")
-            if not ref:
-                continue
-            try:
-                r, col = _cell_ref_to_rc(ref)
-            except Exception:
-                continue
-            values[(r, col)] = _cell_value(c, shared)
-
-        # Determine header row (1)
-        headers: List[str] = []
-        max_col = 0
-        for (r, col), v in values.items():
-            if r == 1:
-                max_col = max(max_col, col)
-        for col in range(1, max_col + 1):
-            hv = values.get((1, col))
-            if hv is None or str(hv).strip() == "":
-                headers.append("")
-            else:
-                headers.append(str(hv).strip())
-
-        # Data rows: until last row with any value
-        max_row = 0
-        for (r, _c) in values.keys():
-            max_row = max(max_row, r)
-        rows: List[Dict[str, Any]] = []
-        for r in range(2, max_row + 1):
-            row_vals: List[Any] = [values.get((r, c)) for c in range(1, max_col + 1)]
-            if all(v is None or (isinstance(v, str) and v.strip() == "") for v in row_vals):
-                continue
-            d: Dict[str, Any] = {}
-            for i, h in enumerate(headers):
-                if not h:
-                    continue
-                d[h] = row_vals[i] if i < len(row_vals) else None
-            rows.append(d)
-        return rows
+
+def read_all_table_rows(xlsx_path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Reads every sheet as a simple table (see read_table_rows) in one pass:
+    the archive is opened and shared strings are parsed only once.
+
+    Returns: sheet_name -> rows
+    """
+    with zipfile.ZipFile(xlsx_path, "r") as z:
+        sheet_map = _workbook_sheet_map(z)
+        shared = _parse_shared_strings(z)
+        return {name: _sheet_table_rows(z, sheet_xml, shared) for name, sheet_xml in sheet_map.items()}